@@ -492,10 +492,10 @@ void ObjTsubo_Idle(ObjTsubo* this, PlayState* play) {
         # Limit to reasonable number for prompt
         context_block = '\n'.join(f'- {item}' for item in all_items[:50])
         
-        patterns = "\n".join(f"- {p}" for p in val.authentic_patterns[:6])
-        issues_block = "\n".join(f"⚠️  {i}" for i in val.issues) or "None"
-        suggestions_block = "\n".join(f"💡 {s}" for s in val.suggestions) or "None"
-        ctx = "\n\n".join(val.required_context)
+        patterns = val.patterns_block
+        issues_block = val.issues_block
+        suggestions_block = val.suggestions_block
+        ctx = val.context_block
         complete_prompt = f"""
 YOU MAY ONLY USE THE FOLLOWING FUNCTIONS AND CONSTANTS (from real OoT decompilation):
 {context_block}
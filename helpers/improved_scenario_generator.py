@@ -6,22 +6,254 @@ Creates natural, diverse training instructions based on real OoT behaviors
 and patterns, avoiding repetitive literal translations.
 """
 
+import json
 import random
-from typing import List, Dict, Tuple
+from functools import lru_cache
+from itertools import repeat
+from operator import itemgetter
+from string import Formatter
+from typing import Callable, List, Dict, Optional, Tuple
 from dataclasses import dataclass
 
+try:
+    import orjson  # Optional: much faster serialisation for main()'s output file
+except ImportError:
+    orjson = None
+
+# Keys of every ScenarioTemplate.complexity_modifiers dict
+_COMPLEXITIES = ("basic", "intermediate", "advanced")
+
+# Pools the generate_*_scenarios methods draw placeholder values from
+_ENEMY_TYPES = (
+    "skeletal warrior", "fire-breathing dragon", "crystal golem", "shadow assassin",
+    "ice elemental", "forest guardian", "stone gargoyle", "lightning spirit",
+    "poison spider", "armored knight", "flying demon", "water serpent",
+    "lava beast", "wind wraith", "earth titan", "void stalker"
+)
+
+_ENEMY_BEHAVIORS = (
+    "teleports behind the player for surprise attacks",
+    "creates defensive barriers when health is low",
+    "summons smaller minions to assist in battle",
+    "changes attack patterns based on player actions",
+    "uses environmental hazards as weapons",
+    "becomes more aggressive as the fight progresses",
+    "has multiple phases with different abilities",
+    "can only be damaged in specific ways",
+    "adapts to the player's combat style",
+    "uses hit-and-run tactics to avoid damage"
+)
+
+_ENEMY_UNIQUE_MECHANICS = (
+    "split into multiple smaller enemies when defeated",
+    "absorb elemental attacks to grow stronger",
+    "phase through walls to ambush the player",
+    "mirror the player's equipped weapon and abilities",
+    "control the battlefield lighting and visibility",
+    "manipulate gravity in the surrounding area",
+    "create illusions to confuse the player",
+    "steal and use the player's items temporarily",
+    "regenerate health by consuming nearby objects",
+    "coordinate attacks with other enemies"
+)
+
+_NPC_CHARACTER_TYPES = (
+    "merchant", "blacksmith", "scholar", "guard", "farmer", "innkeeper",
+    "healer", "sage", "craftsman", "storyteller", "guide", "collector",
+    "trainer", "cook", "librarian", "musician"
+)
+
+_NPC_INTERACTION_TYPES = (
+    "provides hints about nearby secrets",
+    "offers to upgrade the player's equipment",
+    "shares local legends and lore",
+    "gives quests based on player progress",
+    "teaches new skills or abilities",
+    "trades rare items for specific materials",
+    "provides temporary buffs or services",
+    "warns about upcoming dangers",
+    "offers transportation to other areas",
+    "maintains a mini-game or challenge"
+)
+
+_NPC_SERVICE_TYPES = (
+    "item repair and enhancement services",
+    "magical enchantments for equipment",
+    "information about dungeon layouts",
+    "temporary companion assistance",
+    "skill training and tutorials",
+    "rare item trading and exchange",
+    "quest coordination and tracking",
+    "fast travel between locations",
+    "inventory management and storage",
+    "character customization options"
+)
+
+_ITEM_TYPES = (
+    "magical sword", "enchanted bow", "crystal shield", "power gauntlet",
+    "stealth cloak", "healing potion", "puzzle key", "transformation mask",
+    "elemental stone", "ancient relic", "utility tool", "consumable scroll"
+)
+
+_ITEM_FUNCTIONALITIES = (
+    "reveals hidden passages and secrets",
+    "allows temporary flight or levitation",
+    "creates protective barriers against attacks",
+    "transforms the player's appearance or abilities",
+    "provides enhanced vision in dark areas",
+    "manipulates time flow in small areas",
+    "controls elemental forces like fire or ice",
+    "grants telepathic communication with NPCs",
+    "opens dimensional portals for fast travel",
+    "amplifies the player's magical abilities"
+)
+
+_OBJECT_TYPES = (
+    "pressure switch", "rotating platform", "sliding door", "magical portal",
+    "crystal mechanism", "ancient statue", "mechanical lift", "energy conduit",
+    "puzzle pedestal", "temporal gate", "elemental altar", "gravity well"
+)
+
+_OBJECT_MECHANISMS = (
+    "activates when multiple conditions are met",
+    "moves in complex patterns to create platforms",
+    "opens passages based on player inventory",
+    "responds to specific musical sequences",
+    "changes the room's layout dynamically",
+    "creates temporary bridges across gaps",
+    "manipulates light and shadow patterns",
+    "generates force fields and barriers",
+    "controls water levels and flow",
+    "synchronizes with other mechanisms"
+)
+
+_BACKGROUND_EFFECTS = (
+    "changes lighting based on time of day",
+    "creates dynamic weather patterns",
+    "responds to player actions with environmental changes",
+    "generates ambient sounds and atmosphere",
+    "controls temperature and environmental hazards"
+)
+
+_BACKGROUND_ENVIRONMENTS = ("temple", "forest", "cave", "mountain", "lake")
+
+_EFFECT_TYPES = ("particle", "lighting", "magical", "elemental", "atmospheric")
+
+_EFFECT_VISUAL_BEHAVIORS = (
+    "creates swirling energy patterns",
+    "generates cascading light effects",
+    "produces dynamic color transitions",
+    "creates realistic fire and smoke",
+    "generates magical aura effects"
+)
+
+_PLAYER_SYSTEM_TYPES = ("combat", "movement", "interaction", "inventory", "progression")
+
+_PLAYER_FUNCTIONALITIES = (
+    "adapts to different weapon types",
+    "provides responsive movement controls",
+    "handles complex object interactions",
+    "manages item collection and usage",
+    "tracks player progress and achievements"
+)
+
+_MISC_SYSTEM_TYPES = ("save", "audio", "camera", "UI", "networking")
+
+_MISC_BEHAVIORS = (
+    "automatically saves progress at checkpoints",
+    "dynamically adjusts audio based on environment",
+    "smoothly follows player movement",
+    "provides intuitive menu navigation",
+    "handles multiplayer synchronization"
+)
+
 @dataclass
 class ScenarioTemplate:
     """Template for generating diverse scenarios"""
+    # Read on every generated scenario, so use slot access instead of a __dict__
+    __slots__ = ('base_pattern', 'variations', 'complexity_modifiers', 'context_variations')
+    
     base_pattern: str
     variations: List[str]
     complexity_modifiers: Dict[str, List[str]]
     context_variations: List[str]
 
+@lru_cache(maxsize=None)
+def _compile_variation(variation: str, slot_names: Tuple[str, ...]) -> Tuple[str, Callable]:
+    """Parse a variation once into a %-style pattern and a getter for its slot values"""
+    parts = []
+    indexes = []
+    for literal, name, format_spec, conversion in Formatter().parse(variation):
+        parts.append(literal.replace("%", "%%"))
+        if name is not None:
+            if format_spec:
+                raise ValueError(f"Format specs are not supported in scenario variations: {variation!r}")
+            parts.append(f"%{conversion or 's'}")
+            indexes.append(slot_names.index(name))
+    # A single index makes itemgetter return the bare string, which % accepts too
+    pick = itemgetter(*indexes) if indexes else lambda values: ()
+    return "".join(parts), pick
+
+@dataclass(frozen=True)
+class ScenarioSpec:
+    """How one scenario category is drawn"""
+    templates: str  # Name of the generator attribute holding the category's templates
+    slots: Dict[str, Tuple[str, ...]]  # Placeholder name -> pool its values come from
+    modifier_chance: float = 0.0
+    context_chance: float = 0.0
+
+_SCENARIO_SPECS: Dict[str, ScenarioSpec] = {
+    "enemy": ScenarioSpec(
+        "enemy_templates",
+        {"enemy_type": _ENEMY_TYPES, "behavior": _ENEMY_BEHAVIORS, "unique_mechanic": _ENEMY_UNIQUE_MECHANICS},
+        modifier_chance=0.7,
+        context_chance=0.5,
+    ),
+    "npc": ScenarioSpec(
+        "npc_templates",
+        {"character_type": _NPC_CHARACTER_TYPES, "interaction_type": _NPC_INTERACTION_TYPES,
+         "service_type": _NPC_SERVICE_TYPES},
+        modifier_chance=0.6,
+        context_chance=0.4,
+    ),
+    "item": ScenarioSpec(
+        "item_templates",
+        {"item_type": _ITEM_TYPES, "functionality": _ITEM_FUNCTIONALITIES},
+        modifier_chance=0.6,
+        context_chance=0.5,
+    ),
+    "object": ScenarioSpec(
+        "object_templates",
+        {"object_type": _OBJECT_TYPES, "mechanism": _OBJECT_MECHANISMS},
+        modifier_chance=0.7,
+        context_chance=0.6,
+    ),
+    "background": ScenarioSpec(
+        "background_templates",
+        {"effect": _BACKGROUND_EFFECTS, "environment_type": _BACKGROUND_ENVIRONMENTS},
+    ),
+    "effect": ScenarioSpec(
+        "effect_templates",
+        {"effect_type": _EFFECT_TYPES, "visual_behavior": _EFFECT_VISUAL_BEHAVIORS},
+    ),
+    "player": ScenarioSpec(
+        "player_templates",
+        {"system_type": _PLAYER_SYSTEM_TYPES, "functionality": _PLAYER_FUNCTIONALITIES},
+    ),
+    "misc": ScenarioSpec(
+        "misc_templates",
+        {"system_type": _MISC_SYSTEM_TYPES, "behavior": _MISC_BEHAVIORS},
+    ),
+}
+
 class ImprovedOoTScenarioGenerator:
     """Generates natural, diverse OoT training scenarios"""
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
+        # With a seed, each (category, count) always yields the same scenarios
+        # and repeat requests are served from _seeded_scenarios
+        self.seed = seed
+        self._rng = random.Random(seed)
         self.enemy_templates = self._create_enemy_templates()
         self.npc_templates = self._create_npc_templates()
         self.item_templates = self._create_item_templates()
@@ -31,6 +263,16 @@ class ImprovedOoTScenarioGenerator:
         self.player_templates = self._create_player_templates()
         self.misc_templates = self._create_misc_templates()
         
+        # Each category's templates paired with their parsed variations
+        self._prepared_templates = {
+            category: [
+                (template, tuple(_compile_variation(variation, tuple(spec.slots))
+                                 for variation in template.variations))
+                for template in getattr(self, spec.templates)
+            ]
+            for category, spec in _SCENARIO_SPECS.items()
+        }
+        
     def _create_enemy_templates(self) -> List[ScenarioTemplate]:
         """Create natural enemy scenario templates"""
         return [
@@ -280,228 +522,79 @@ class ImprovedOoTScenarioGenerator:
             )
         ]
     
-    def generate_enemy_scenarios(self, count: int = 20) -> List[str]:
-        """Generate natural enemy scenarios"""
-        scenarios = []
-        enemy_types = [
-            "skeletal warrior", "fire-breathing dragon", "crystal golem", "shadow assassin",
-            "ice elemental", "forest guardian", "stone gargoyle", "lightning spirit",
-            "poison spider", "armored knight", "flying demon", "water serpent",
-            "lava beast", "wind wraith", "earth titan", "void stalker"
-        ]
+    def _generate(self, category: str, count: int) -> List[str]:
+        """Generate count scenarios for one category as described by _SCENARIO_SPECS"""
+        if self.seed is not None:
+            return list(_seeded_scenarios(category, count, self.seed))
         
-        behaviors = [
-            "teleports behind the player for surprise attacks",
-            "creates defensive barriers when health is low",
-            "summons smaller minions to assist in battle",
-            "changes attack patterns based on player actions",
-            "uses environmental hazards as weapons",
-            "becomes more aggressive as the fight progresses",
-            "has multiple phases with different abilities",
-            "can only be damaged in specific ways",
-            "adapts to the player's combat style",
-            "uses hit-and-run tactics to avoid damage"
-        ]
+        spec = _SCENARIO_SPECS[category]
+        rng = self._rng
         
-        unique_mechanics = [
-            "split into multiple smaller enemies when defeated",
-            "absorb elemental attacks to grow stronger",
-            "phase through walls to ambush the player",
-            "mirror the player's equipped weapon and abilities",
-            "control the battlefield lighting and visibility",
-            "manipulate gravity in the surrounding area",
-            "create illusions to confuse the player",
-            "steal and use the player's items temporarily",
-            "regenerate health by consuming nearby objects",
-            "coordinate attacks with other enemies"
-        ]
+        # Draw each slot for the whole batch at once; categories without
+        # modifiers or context never roll for them (a 1.0 roll never passes)
+        templates = rng.choices(self._prepared_templates[category], k=count)
+        slot_values = zip(*[rng.choices(pool, k=count) for pool in spec.slots.values()])
+        roll = rng.random
+        modifier_chance = spec.modifier_chance
+        context_chance = spec.context_chance
+        if not (modifier_chance or context_chance):
+            # Plain variations only, so build the list in one comprehension
+            return [pattern % pick(values)
+                    for (_, variations), values in zip(templates, slot_values)
+                    for pattern, pick in (variations[int(roll() * len(variations))],)]
         
-        for i in range(count):
-            template = random.choice(self.enemy_templates)
-            variation = random.choice(template.variations)
-            complexity = random.choice(["basic", "intermediate", "advanced"])
-            
-            if "{unique_mechanic}" in variation:
-                scenario = variation.format(
-                    enemy_type=random.choice(enemy_types),
-                    unique_mechanic=random.choice(unique_mechanics)
-                )
-            else:
-                scenario = variation.format(
-                    enemy_type=random.choice(enemy_types),
-                    behavior=random.choice(behaviors)
-                )
+        if modifier_chance:
+            complexities = rng.choices(_COMPLEXITIES, k=count)
+            modifier_rolls = [rng.random() for _ in range(count)]
+        else:
+            complexities = repeat(None, count)
+            modifier_rolls = repeat(1.0, count)
+        if context_chance:
+            context_rolls = [rng.random() for _ in range(count)]
+        else:
+            context_rolls = repeat(1.0, count)
+        
+        scenarios = []
+        for (template, variations), values, complexity, modifier_roll, context_roll in zip(
+                templates, slot_values, complexities, modifier_rolls, context_rolls):
+            # Variations ignore any slots they don't use
+            pattern, pick = variations[int(roll() * len(variations))]
+            scenario = pattern % pick(values)
             
             # Add complexity modifier
-            if random.random() < 0.7:  # 70% chance to add complexity
-                modifier = random.choice(template.complexity_modifiers[complexity])
-                scenario += f" {modifier}"
+            modifier = ""
+            if modifier_roll < modifier_chance:
+                modifiers = template.complexity_modifiers[complexity]
+                modifier = modifiers[int(roll() * len(modifiers))]
             
             # Add context variation
-            if random.random() < 0.5:  # 50% chance to add context
-                context = random.choice(template.context_variations)
-                scenario += f" {context}"
+            context = ""
+            if context_roll < context_chance:
+                contexts = template.context_variations
+                context = contexts[int(roll() * len(contexts))]
             
+            # Assemble in one pass, skipping whichever optional parts were not picked
+            if modifier or context:
+                scenario = " ".join(filter(None, (scenario, modifier, context)))
             scenarios.append(scenario)
         
         return scenarios
     
+    def generate_enemy_scenarios(self, count: int = 20) -> List[str]:
+        """Generate natural enemy scenarios"""
+        return self._generate("enemy", count)
+    
     def generate_npc_scenarios(self, count: int = 20) -> List[str]:
         """Generate natural NPC scenarios"""
-        scenarios = []
-        character_types = [
-            "merchant", "blacksmith", "scholar", "guard", "farmer", "innkeeper",
-            "healer", "sage", "craftsman", "storyteller", "guide", "collector",
-            "trainer", "cook", "librarian", "musician"
-        ]
-        
-        interaction_types = [
-            "provides hints about nearby secrets",
-            "offers to upgrade the player's equipment",
-            "shares local legends and lore",
-            "gives quests based on player progress",
-            "teaches new skills or abilities",
-            "trades rare items for specific materials",
-            "provides temporary buffs or services",
-            "warns about upcoming dangers",
-            "offers transportation to other areas",
-            "maintains a mini-game or challenge"
-        ]
-        
-        service_types = [
-            "item repair and enhancement services",
-            "magical enchantments for equipment",
-            "information about dungeon layouts",
-            "temporary companion assistance",
-            "skill training and tutorials",
-            "rare item trading and exchange",
-            "quest coordination and tracking",
-            "fast travel between locations",
-            "inventory management and storage",
-            "character customization options"
-        ]
-        
-        for i in range(count):
-            template = random.choice(self.npc_templates)
-            variation = random.choice(template.variations)
-            complexity = random.choice(["basic", "intermediate", "advanced"])
-            
-            if "{service_type}" in variation:
-                scenario = variation.format(
-                    character_type=random.choice(character_types),
-                    service_type=random.choice(service_types)
-                )
-            else:
-                scenario = variation.format(
-                    character_type=random.choice(character_types),
-                    interaction_type=random.choice(interaction_types)
-                )
-            
-            # Add complexity modifier
-            if random.random() < 0.6:
-                modifier = random.choice(template.complexity_modifiers[complexity])
-                scenario += f" {modifier}"
-            
-            # Add context variation
-            if random.random() < 0.4:
-                context = random.choice(template.context_variations)
-                scenario += f" {context}"
-            
-            scenarios.append(scenario)
-        
-        return scenarios
+        return self._generate("npc", count)
     
     def generate_item_scenarios(self, count: int = 15) -> List[str]:
         """Generate natural item scenarios"""
-        scenarios = []
-        item_types = [
-            "magical sword", "enchanted bow", "crystal shield", "power gauntlet",
-            "stealth cloak", "healing potion", "puzzle key", "transformation mask",
-            "elemental stone", "ancient relic", "utility tool", "consumable scroll"
-        ]
-        
-        functionalities = [
-            "reveals hidden passages and secrets",
-            "allows temporary flight or levitation",
-            "creates protective barriers against attacks",
-            "transforms the player's appearance or abilities",
-            "provides enhanced vision in dark areas",
-            "manipulates time flow in small areas",
-            "controls elemental forces like fire or ice",
-            "grants telepathic communication with NPCs",
-            "opens dimensional portals for fast travel",
-            "amplifies the player's magical abilities"
-        ]
-        
-        for i in range(count):
-            template = random.choice(self.item_templates)
-            variation = random.choice(template.variations)
-            complexity = random.choice(["basic", "intermediate", "advanced"])
-            
-            scenario = variation.format(
-                item_type=random.choice(item_types),
-                functionality=random.choice(functionalities)
-            )
-            
-            # Add complexity modifier
-            if random.random() < 0.6:
-                modifier = random.choice(template.complexity_modifiers[complexity])
-                scenario += f" {modifier}"
-            
-            # Add context variation
-            if random.random() < 0.5:
-                context = random.choice(template.context_variations)
-                scenario += f" {context}"
-            
-            scenarios.append(scenario)
-        
-        return scenarios
+        return self._generate("item", count)
     
     def generate_object_scenarios(self, count: int = 15) -> List[str]:
         """Generate natural object scenarios"""
-        scenarios = []
-        object_types = [
-            "pressure switch", "rotating platform", "sliding door", "magical portal",
-            "crystal mechanism", "ancient statue", "mechanical lift", "energy conduit",
-            "puzzle pedestal", "temporal gate", "elemental altar", "gravity well"
-        ]
-        
-        mechanisms = [
-            "activates when multiple conditions are met",
-            "moves in complex patterns to create platforms",
-            "opens passages based on player inventory",
-            "responds to specific musical sequences",
-            "changes the room's layout dynamically",
-            "creates temporary bridges across gaps",
-            "manipulates light and shadow patterns",
-            "generates force fields and barriers",
-            "controls water levels and flow",
-            "synchronizes with other mechanisms"
-        ]
-        
-        for i in range(count):
-            template = random.choice(self.object_templates)
-            variation = random.choice(template.variations)
-            complexity = random.choice(["basic", "intermediate", "advanced"])
-            
-            scenario = variation.format(
-                object_type=random.choice(object_types),
-                mechanism=random.choice(mechanisms)
-            )
-            
-            # Add complexity modifier
-            if random.random() < 0.7:
-                modifier = random.choice(template.complexity_modifiers[complexity])
-                scenario += f" {modifier}"
-            
-            # Add context variation
-            if random.random() < 0.6:
-                context = random.choice(template.context_variations)
-                scenario += f" {context}"
-            
-            scenarios.append(scenario)
-        
-        return scenarios
+        return self._generate("object", count)
     
     def generate_all_scenarios(self) -> Dict[str, List[str]]:
         """Generate all scenario types"""
@@ -518,94 +611,27 @@ class ImprovedOoTScenarioGenerator:
     
     def generate_background_scenarios(self, count: int = 10) -> List[str]:
         """Generate natural background/environmental scenarios"""
-        scenarios = []
-        effects = [
-            "changes lighting based on time of day",
-            "creates dynamic weather patterns",
-            "responds to player actions with environmental changes",
-            "generates ambient sounds and atmosphere",
-            "controls temperature and environmental hazards"
-        ]
-        
-        for i in range(count):
-            template = random.choice(self.background_templates)
-            variation = random.choice(template.variations)
-            scenario = variation.format(
-                effect=random.choice(effects),
-                environment_type=random.choice(["temple", "forest", "cave", "mountain", "lake"])
-            )
-            scenarios.append(scenario)
-        
-        return scenarios
+        return self._generate("background", count)
     
     def generate_effect_scenarios(self, count: int = 10) -> List[str]:
         """Generate natural effect scenarios"""
-        scenarios = []
-        effect_types = ["particle", "lighting", "magical", "elemental", "atmospheric"]
-        visual_behaviors = [
-            "creates swirling energy patterns",
-            "generates cascading light effects",
-            "produces dynamic color transitions",
-            "creates realistic fire and smoke",
-            "generates magical aura effects"
-        ]
-        
-        for i in range(count):
-            template = random.choice(self.effect_templates)
-            variation = random.choice(template.variations)
-            scenario = variation.format(
-                effect_type=random.choice(effect_types),
-                visual_behavior=random.choice(visual_behaviors)
-            )
-            scenarios.append(scenario)
-        
-        return scenarios
+        return self._generate("effect", count)
     
     def generate_player_scenarios(self, count: int = 10) -> List[str]:
         """Generate natural player system scenarios"""
-        scenarios = []
-        system_types = ["combat", "movement", "interaction", "inventory", "progression"]
-        functionalities = [
-            "adapts to different weapon types",
-            "provides responsive movement controls",
-            "handles complex object interactions",
-            "manages item collection and usage",
-            "tracks player progress and achievements"
-        ]
-        
-        for i in range(count):
-            template = random.choice(self.player_templates)
-            variation = random.choice(template.variations)
-            scenario = variation.format(
-                system_type=random.choice(system_types),
-                functionality=random.choice(functionalities)
-            )
-            scenarios.append(scenario)
-        
-        return scenarios
+        return self._generate("player", count)
     
     def generate_misc_scenarios(self, count: int = 10) -> List[str]:
         """Generate natural miscellaneous scenarios"""
-        scenarios = []
-        system_types = ["save", "audio", "camera", "UI", "networking"]
-        behaviors = [
-            "automatically saves progress at checkpoints",
-            "dynamically adjusts audio based on environment",
-            "smoothly follows player movement",
-            "provides intuitive menu navigation",
-            "handles multiplayer synchronization"
-        ]
-        
-        for i in range(count):
-            template = random.choice(self.misc_templates)
-            variation = random.choice(template.variations)
-            scenario = variation.format(
-                system_type=random.choice(system_types),
-                behavior=random.choice(behaviors)
-            )
-            scenarios.append(scenario)
-        
-        return scenarios
+        return self._generate("misc", count)
+
+@lru_cache(maxsize=128)
+def _seeded_scenarios(category: str, count: int, seed: int) -> Tuple[str, ...]:
+    """Generate one category's scenarios from a fixed seed, memoised per (category, count, seed)"""
+    # An unseeded generator runs the real draw; give it its own seeded stream
+    generator = ImprovedOoTScenarioGenerator()
+    generator._rng.seed(seed)
+    return tuple(generator._generate(category, count))
 
 def main():
     """Generate improved scenarios"""
@@ -624,9 +650,12 @@ def main():
             print(f"   ... and {len(scenarios) - 5} more")
     
     # Save to file
-    import json
-    with open("improved_scenarios.json", "w") as f:
-        json.dump(all_scenarios, f, indent=2)
+    if orjson is not None:
+        with open("improved_scenarios.json", "wb") as f:
+            f.write(orjson.dumps(all_scenarios, option=orjson.OPT_INDENT_2))
+    else:
+        with open("improved_scenarios.json", "w") as f:
+            json.dump(all_scenarios, f, indent=2)
     
     print(f"\n💾 Saved {sum(len(s) for s in all_scenarios.values())} scenarios to improved_scenarios.json")
 
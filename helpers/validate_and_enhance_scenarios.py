@@ -11,6 +11,7 @@ Enhanced version with comprehensive pattern validation.
 """
 
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from typing import List, Tuple, Dict, Set, Optional
 import re
 import os
@@ -86,7 +87,7 @@ logger = OoTLogger()
 # Data classes
 # ------------------------------------------------------------
 
-@dataclass
+@dataclass(frozen=True)
 class ValidationResult:
     """Result of scenario validation"""
     is_valid: bool
@@ -95,6 +96,25 @@ class ValidationResult:
     authentic_patterns: List[str]
     required_context: List[str]
 
+    # Prompt blocks, built on first use so repeated prompts from one result reuse them
+
+    @cached_property
+    def patterns_block(self) -> str:
+        patterns = self.authentic_patterns[:6]
+        return ("- " + "\n- ".join(patterns)) if patterns else ""
+
+    @cached_property
+    def issues_block(self) -> str:
+        return ("⚠️  " + "\n⚠️  ".join(self.issues)) if self.issues else "None"
+
+    @cached_property
+    def suggestions_block(self) -> str:
+        return ("💡 " + "\n💡 ".join(self.suggestions)) if self.suggestions else "None"
+
+    @cached_property
+    def context_block(self) -> str:
+        return "\n\n".join(self.required_context)
+
 # ------------------------------------------------------------
 # OoT Authentic Patterns Database
 # ------------------------------------------------------------
@@ -135,54 +155,114 @@ class OoTAuthenticPatterns:
 # Validator class
 # ------------------------------------------------------------
 
-class OoTPatternValidator:
-    """Validate scenario text against known OoT patterns (enhanced version)."""
-
-    def __init__(self, oot_path: str = "oot") -> None:
-        self.oot_path = oot_path
-        self.context_templates = self._build_context_templates()
-        self.patterns = OoTAuthenticPatterns()
-
-    # ------------------------ public API ---------------------
-
-    def validate_scenario(self, scenario: str, category: str) -> ValidationResult:
-        category = category.lower().strip()
-        if category == "enemy":
-            issues, sugg, pats = self._validate_enemy_scenario(scenario)
-            ctx = [self.context_templates["enemy"]]
-        elif category == "npc":
-            issues, sugg, pats = self._validate_npc_scenario(scenario)
-            ctx = [self.context_templates["npc"]]
-        elif category == "item":
-            issues, sugg, pats = self._validate_item_scenario(scenario)
-            ctx = [self.context_templates["item"]]
-        else:
-            # treat anything else as object/mechanism
-            issues, sugg, pats = self._validate_object_scenario(scenario)
-            ctx = [self.context_templates["object"]]
-
-        return ValidationResult(
-            is_valid=len(issues) == 0,
-            issues=issues,
-            suggestions=sugg,
-            authentic_patterns=pats,
-            required_context=ctx,
-        )
+# Scenario keywords that show an item / object category is concrete. They
+# match anywhere in a word ("rupees", "keys"), so they are substring checks.
+_ITEM_WORDS = ("item", "rupee", "heart", "key", "mask")
+_OBJECT_WORDS = ("switch", "platform", "door", "mechanism", "puzzle")
+_ITEM_RE = re.compile("|".join(_ITEM_WORDS), re.I)
+_OBJECT_RE = re.compile("|".join(_OBJECT_WORDS), re.I)
+# Any of these in an enemy scenario counts as describing actor behaviour. Ordered
+# so the keywords generated enemy scenarios hit most often are tried first.
+_ACTOR_KEYWORDS = ("attack", "implement", "build", "create", "enemy", "damage", "state", "boss", "actor")
+
+# Authentic patterns suggested for each scenario category
+_ENEMY_PATTERNS = (
+    "Use Actor_WorldDistXZToActor for distance checks",
+    "State machine via `actionState` field",
+    "Damage via Actor_ApplyDamage + Enemy_StartFinishingBlow",
+    "Collision with Collider_InitCylinder + CollisionCheck_SetAC",
+    "Animation with SkelAnime_InitFlex + SkelAnime_Update",
+)
+_NPC_PATTERNS = (
+    "Dialogue via Npc_UpdateTalking and TEXT_STATE_CLOSING",
+    "Tracking with NpcInteractInfo structure",
+    "Text IDs handled in GetTextId function",
+)
+_ITEM_PATTERNS = (
+    "Spawn with EnItem00 and ITEM00_* params",
+    "Use EnItem00 for collectibles",
+    "ITEM00_* constants for types",
+    "Bobbing animation via Math_SinS",
+)
+_OBJECT_PATTERNS = (
+    "Use DynaPolyActor for moving/mechanic objects",
+    "Switch state toggled with Flags_Get/SetSwitch",
+    "Movement with Math_ApproachF",
+    "Collision via DynaPoly_SetBgActor",
+)
+
+# Patterns _check_nonexistent_patterns uses to find user-defined symbols and references
+_FUNC_DEF_PATTERN = re.compile(r'^[ \t]*(?:static[ \t]+)?(?:[A-Za-z_][A-Za-z0-9_\* ]+)[ \t]+([A-Za-z_][A-Za-z0-9_]*)\s*\([^)]*\)\s*\{', re.MULTILINE)
+_MACRO_PATTERN = re.compile(r'^\s*#define\s+([A-Za-z_][A-Za-z0-9_]*)', re.MULTILINE)
+_MACRO_REF_PATTERN = re.compile(r'#define\s+([A-Z][A-Z0-9_]*)\s*\([^)]*\)')
+_TYPEDEF_PATTERN = re.compile(r'typedef\s+(?:struct|enum|union)\s*\w*\s*\{[^}]+\}\s*([A-Za-z_][A-Za-z0-9_]*);', re.DOTALL)
+_TYPEDEF_ENUM_PATTERN = re.compile(r'typedef\s+enum\s*\w*\s*\{([^}]+)\}', re.DOTALL)
+_INLINE_ENUM_PATTERN = re.compile(r'enum\s*\w*\s*\{([^}]+)\}', re.DOTALL)
+_NAMED_ENUM_PATTERN = re.compile(r'enum\s+[A-Za-z_][A-Za-z0-9_]*\s*\{([^}]+)\}', re.DOTALL)
+_ENUM_CONSTANT_PATTERN = re.compile(r'([A-Z][A-Z0-9_]*)\s*(?:,|$)')
+_DEFINE_VALUE_PATTERN = re.compile(r'#define\s+([A-Z][A-Z0-9_]*)\s+[^\n]+')
+_CONST_DECL_PATTERN = re.compile(r'const\s+[A-Za-z_][A-Za-z0-9_]*\s+([A-Z][A-Z0-9_]*)\s*=')
+_STATIC_CONST_PATTERN = re.compile(r'static\s+const\s+[A-Za-z_][A-Za-z0-9_]*\s+([A-Z][A-Z0-9_]*)\s*=')
+_FUNC_CALL_PATTERN = re.compile(r'\b([A-Z][A-Za-z0-9_]*)\s*\(')
+_CONSTANT_PATTERN = re.compile(r'\b([A-Z][A-Z0-9_]{2,})\b')
+
+# Known C keywords and builtins to ignore
+_C_KEYWORDS = frozenset(keyword.kwlist) | frozenset(dir(builtins)) | {
+    'NULL', 'TRUE', 'FALSE', 'bool', 'int', 'float', 'double', 'char', 'void', 'size_t',
+    'u8', 'u16', 'u32', 's8', 's16', 's32', 'f32', 'f64', 'uintptr_t', 'intptr_t',
+    'struct', 'enum', 'union', 'typedef', 'const', 'static', 'extern', 'volatile',
+    'register', 'unsigned', 'signed', 'short', 'long', 'inline', 'restrict',
+    'if', 'else', 'for', 'while', 'do', 'switch', 'case', 'break', 'continue', 'goto', 'return',
+    'sizeof', 'offsetof',
+    # Common C functions that should not be flagged
+    'CLAMP', 'MIN', 'MAX', 'ABS', 'SIGN', 'ROUND', 'FLOOR', 'CEIL',
+    'sin', 'cos', 'tan', 'asin', 'acos', 'atan', 'sinh', 'cosh', 'tanh',
+    'exp', 'log', 'log10', 'pow', 'sqrt', 'fabs', 'floor', 'ceil',
+    'malloc', 'free', 'calloc', 'realloc', 'memcpy', 'memmove', 'memset',
+    'strcpy', 'strcat', 'strcmp', 'strlen', 'strchr', 'strstr',
+}
 
-    def create_enhanced_prompt(self, scenario: str, category: str, val: ValidationResult) -> str:
-        """Return a rich prompt containing requirements & authentic snippets."""
-        patterns = "\n".join(f"- {p}" for p in val.authentic_patterns[:6])
-        issues_block = "\n".join(f"⚠️  {i}" for i in val.issues) or "None"
-        suggestions_block = "\n".join(f"💡 {s}" for s in val.suggestions) or "None"
-        ctx = "\n\n".join(val.required_context)
-        
-        # Add OoT pattern examples
-        oot_examples = self._get_oot_pattern_examples(category)
-        
-        return f"""
+# Common romhacking constants that are user-defined
+_ROMHACKING_CONSTANTS = frozenset({
+    'COLTYPE_NONE', 'COLTYPE_HIT1', 'COLTYPE_HIT2', 'COLTYPE_HIT3',
+    'COLSHAPE_CYLINDER', 'COLSHAPE_SPHERE', 'COLSHAPE_BOX', 'COLSHAPE_TRIS',
+    'ELEMTYPE_UNK0', 'ELEMTYPE_UNK1', 'ELEMTYPE_UNK2', 'ELEMTYPE_UNK3',
+    'TOUCH_NONE', 'TOUCH_ON', 'BUMP_ON', 'BUMP_NONE',
+    'OC_ON', 'OC_NONE', 'OCELEM_ON', 'OCELEM_NONE',
+    'AT_NONE', 'AT_ON', 'AC_ON', 'AC_NONE',
+    'ACTORCAT_ENEMY', 'ACTORCAT_NPC', 'ACTORCAT_MISC', 'ACTORCAT_ITEMACTION',
+    'ACTOR_FLAG_0', 'ACTOR_FLAG_1', 'ACTOR_FLAG_2', 'ACTOR_FLAG_3', 'ACTOR_FLAG_4', 'ACTOR_FLAG_5',
+    'MASS_IMMOVABLE', 'MASS_50', 'MASS_40', 'MASS_30',
+    'OBJECT_GAMEPLAY_KEEP', 'OBJECT_GAMEPLAY_DANGEON_KEEP',
+    'UPDBGCHECKINFO_FLAG_0', 'UPDBGCHECKINFO_FLAG_2', 'UPDBGCHECKINFO_FLAG_4',
+    'FLAGS_NONE', 'FLAGS_0', 'FLAGS_1', 'FLAGS_2', 'FLAGS_3', 'FLAGS_4', 'FLAGS_5'
+})
+
+# Number of recent scenarios each validator remembers results for
+_CACHE_SIZE = 1024
+
+def _remember(cache: dict, key, value):
+    """Store a result in a bounded cache, evicting the oldest entry when full"""
+    if len(cache) >= _CACHE_SIZE:
+        cache.pop(next(iter(cache)))
+    cache[key] = value
+    return value
+
+def _mentions_any(text: str, words: Tuple[str, ...], pattern: "re.Pattern") -> bool:
+    """True if text contains any of words, ignoring case (pattern is their re.I alternation)"""
+    if text.isascii():
+        # Case-insensitive alternations scan slowly; lower() + `in` gives the same answer on ASCII
+        lowered = text.lower()
+        return any(word in lowered for word in words)
+    # re.I also folds non-ASCII look-alikes such as 'ſ' and 'K' (Kelvin sign)
+    return pattern.search(text) is not None
+
+# Fixed text of create_enhanced_prompt around its per-call blocks
+_PROMPT_HEAD = """
 You are generating **authentic OoT rom-hacking code**.  Follow REAL decompilation patterns.
 
-SCENARIO (category={category}): {scenario}
+SCENARIO (category="""
+_PROMPT_REQUIREMENTS = """
 
 STRICT REQUIREMENTS:
 1. Function signatures **must** be `(Actor* thisx, PlayState* play)`
@@ -197,27 +277,167 @@ STRICT REQUIREMENTS:
 10. **REQUIRED**: Add proper casting: `ActorName* this = (ActorName*)thisx;`
 
 AUTHENTIC PATTERNS TO EMULATE:
-{patterns}
-
-OoT PATTERN EXAMPLES:
-{oot_examples}
-
-KNOWN ISSUES:
-{issues_block}
-
-SUGGESTIONS TO IMPROVE:
-{suggestions_block}
-
-{ctx}
+"""
+_PROMPT_TAIL = """
 
 Return exactly this JSON:
-{{
+{
   "instruction": "clear instruction",
   "input": null,
   "output": "C code here"
-}}
+}
 """
 
+class OoTPatternValidator:
+    """Validate scenario text against known OoT patterns (enhanced version)."""
+
+    # Category context blocks fed to the LLM; shared by every validator
+    context_templates: Dict[str, str] = {
+        "enemy": (
+            "AUTHENTIC ENEMY PATTERNS:\n"
+            "- Collider_InitCylinder for body\n"
+            "- actionState enum controlling AI\n"
+            "- Damage handled with Actor_ApplyDamage\n"
+            "- Distance checks via Actor_WorldDistXZToActor\n"
+            "- Use Actor_PlaySfx for sound effects\n"
+            "- State machine with actionFunc pointer\n"
+            "- REQUIRED: ActorProfile struct at end\n"
+            "- REQUIRED: ColliderCylinderInit static struct\n"
+            "- REQUIRED: Proper struct with Actor as first field\n"
+            "- REQUIRED: Function signatures (Actor* thisx, PlayState* play)\n"
+            "\n🚨 CRITICAL WARNINGS:\n"
+            "✗ NEVER use Gfx_DrawDListOpa(play, gSomeDL) - this function doesn't exist\n"
+            "✗ NEVER directly manipulate player->actor.world.pos or player->actor.velocity\n"
+            "✗ NEVER access player->health or player->healthCapacity\n"
+            "✗ NEVER use SkelAnime functions without declaring SkelAnime in struct\n"
+            "✗ NEVER use ACTOR_FLAG_8 or other non-existent flags\n"
+            "✓ Use SkelAnime_DrawOpa(play, this->skelAnime.skeleton, this->skelAnime.jointTable, NULL, NULL, this)\n"
+            "✓ Use gSaveContext.health and gSaveContext.healthCapacity for player health\n"
+            "✓ Use proper flag checking: if (this->actor.flags & ACTOR_FLAG_0)\n"
+            "✓ Declare SkelAnime skelAnime; in struct if using skeleton animation"
+        ),
+        "npc": (
+            "AUTHENTIC NPC PATTERNS:\n"
+            "- Dialogue via Npc_UpdateTalking\n"
+            "- Text IDs handled in GetTextId function\n"
+            "- Tracking player with NpcInteractInfo\n"
+            "- Use Actor_PlaySfx for sound effects\n"
+            "- State machine with actionFunc pointer\n"
+            "- REQUIRED: ActorProfile struct at end\n"
+            "- REQUIRED: ColliderCylinderInit static struct\n"
+            "- REQUIRED: Proper struct with Actor as first field\n"
+            "- REQUIRED: Function signatures (Actor* thisx, PlayState* play)\n"
+            "\n🚨 CRITICAL WARNINGS:\n"
+            "✗ NEVER use Gfx_DrawDListOpa(play, gSomeDL) - this function doesn't exist\n"
+            "✗ NEVER directly manipulate player->actor.world.pos or player->actor.velocity\n"
+            "✗ NEVER access player->health or player->healthCapacity\n"
+            "✗ NEVER use SkelAnime functions without declaring SkelAnime in struct\n"
+            "✗ NEVER use ACTOR_FLAG_8 or other non-existent flags\n"
+            "✓ Use SkelAnime_DrawOpa(play, this->skelAnime.skeleton, this->skelAnime.jointTable, NULL, NULL, this)\n"
+            "✓ Use gSaveContext.health and gSaveContext.healthCapacity for player health\n"
+            "✓ Use proper flag checking: if (this->actor.flags & ACTOR_FLAG_0)\n"
+            "✓ Declare SkelAnime skelAnime; in struct if using skeleton animation"
+        ),
+        "item": (
+            "AUTHENTIC ITEM PATTERNS:\n"
+            "- Use EnItem00 for collectibles\n"
+            "- ITEM00_* constants for types\n"
+            "- Bobbing animation via Math_SinS\n"
+            "- Use Actor_PlaySfx for sound effects\n"
+            "- Collision with Collider_InitCylinder\n"
+            "- REQUIRED: ActorProfile struct at end\n"
+            "- REQUIRED: ColliderCylinderInit static struct\n"
+            "- REQUIRED: Proper struct with Actor as first field\n"
+            "- REQUIRED: Function signatures (Actor* thisx, PlayState* play)\n"
+            "\n🚨 CRITICAL WARNINGS:\n"
+            "✗ NEVER use Gfx_DrawDListOpa(play, gSomeDL) - this function doesn't exist\n"
+            "✗ NEVER directly manipulate player->actor.world.pos or player->actor.velocity\n"
+            "✗ NEVER access player->health or player->healthCapacity\n"
+            "✗ NEVER use SkelAnime functions without declaring SkelAnime in struct\n"
+            "✗ NEVER use ACTOR_FLAG_8 or other non-existent flags\n"
+            "✓ Use SkelAnime_DrawOpa(play, this->skelAnime.skeleton, this->skelAnime.jointTable, NULL, NULL, this)\n"
+            "✓ Use gSaveContext.health and gSaveContext.healthCapacity for player health\n"
+            "✓ Use proper flag checking: if (this->actor.flags & ACTOR_FLAG_0)\n"
+            "✓ Declare SkelAnime skelAnime; in struct if using skeleton animation"
+        ),
+        "object": (
+            "AUTHENTIC OBJECT PATTERNS:\n"
+            "- Mechanics via DynaPolyActor\n"
+            "- Switch state toggled with Flags_Get/SetSwitch\n"
+            "- Movement with Math_ApproachF\n"
+            "- Use Actor_PlaySfx for sound effects\n"
+            "- Collision via DynaPoly_SetBgActor\n"
+            "- REQUIRED: ActorProfile struct at end\n"
+            "- REQUIRED: ColliderCylinderInit static struct\n"
+            "- REQUIRED: Proper struct with Actor as first field\n"
+            "- REQUIRED: Function signatures (Actor* thisx, PlayState* play)\n"
+            "- AUTHENTIC PATTERNS ONLY:\n"
+            "  ✓ Use Actor_WorldDistXZToActor(&this->actor, &player->actor) for distance\n"
+            "  ✓ Use SkelAnime_DrawOpa() or Gfx_DrawDListOpa() for drawing\n"
+            "  ✓ Use if (gSaveContext.inventory.items[SLOT_HOOKSHOT] != ITEM_NONE) for items\n"
+            "  ✓ Use Actor_Spawn(&play->actorCtx, play, ACTOR_EN_ITEM00, ...) for spawning\n"
+            "  ✗ NEVER use fabricated patterns like INV_CONTENT(), Actor_DrawOpa(), etc.\n"
+            "\n🚨 CRITICAL WARNINGS:\n"
+            "✗ NEVER use Gfx_DrawDListOpa(play, gSomeDL) - this function doesn't exist\n"
+            "✗ NEVER directly manipulate player->actor.world.pos or player->actor.velocity\n"
+            "✗ NEVER access player->health or player->healthCapacity\n"
+            "✗ NEVER use SkelAnime functions without declaring SkelAnime in struct\n"
+            "✗ NEVER use ACTOR_FLAG_8 or other non-existent flags\n"
+            "✓ Use SkelAnime_DrawOpa(play, this->skelAnime.skeleton, this->skelAnime.jointTable, NULL, NULL, this)\n"
+            "✓ Use gSaveContext.health and gSaveContext.healthCapacity for player health\n"
+            "✓ Use proper flag checking: if (this->actor.flags & ACTOR_FLAG_0)\n"
+            "✓ Declare SkelAnime skelAnime; in struct if using skeleton animation"
+        ),
+    }
+
+    def __init__(self, oot_path: str = "oot") -> None:
+        self.oot_path = oot_path
+        self.patterns = OoTAuthenticPatterns()
+        # (category, scenario) -> (issues, suggestions, patterns, context) tuples
+        self._scenario_cache: Dict[Tuple[str, str], Tuple[Tuple[str, ...], ...]] = {}
+
+    # ------------------------ public API ---------------------
+
+    def validate_scenario(self, scenario: str, category: str) -> ValidationResult:
+        category = category.lower().strip()
+        cached = self._scenario_cache.get((category, scenario))
+        if cached is None:
+            cached = _remember(self._scenario_cache, (category, scenario),
+                               self._validate_scenario(scenario, category))
+        issues, sugg, pats, ctx = cached
+
+        # Fresh lists so callers can't alter what later calls return
+        return ValidationResult(
+            is_valid=len(issues) == 0,
+            issues=list(issues),
+            suggestions=list(sugg),
+            authentic_patterns=list(pats),
+            required_context=list(ctx),
+        )
+
+    def validate_batch(self, scenarios: List[str], categories: List[str]) -> List[ValidationResult]:
+        """Validate scenarios[i] as categories[i]; same results as validate_scenario on each pair."""
+        if len(scenarios) != len(categories):
+            raise ValueError(f"Got {len(scenarios)} scenarios but {len(categories)} categories")
+        validate = self.validate_scenario
+        return [validate(scenario, category) for scenario, category in zip(scenarios, categories)]
+
+    def create_enhanced_prompt(self, scenario: str, category: str, val: ValidationResult) -> str:
+        """Return a rich prompt containing requirements & authentic snippets."""
+        parts = [
+            _PROMPT_HEAD, category, "): ", scenario,
+            _PROMPT_REQUIREMENTS,
+            val.patterns_block,
+            "\n\nOoT PATTERN EXAMPLES:\n", self._get_oot_pattern_examples(category),
+            "\n\nKNOWN ISSUES:\n",
+            val.issues_block,
+            "\n\nSUGGESTIONS TO IMPROVE:\n",
+            val.suggestions_block,
+            "\n\n", val.context_block,
+            _PROMPT_TAIL,
+        ]
+        return "".join(parts)
+
     def validate_code_output(self, code: str, category: str) -> ValidationResult:
         """Validate C code output for function/constant/sfx/struct existence and OoT patterns."""
         issues, sugg, pats = [], [], []
@@ -334,75 +554,67 @@ Return exactly this JSON:
 
     # ------------------------ private helpers ---------------
 
-    def _validate_enemy_scenario(self, s: str) -> Tuple[List[str], List[str], List[str]]:
-        issues, sugg, pats = [], [], []
+    def _validate_scenario(self, scenario: str, category: str) -> Tuple[Tuple[str, ...], ...]:
+        """Run the category's scenario checks; returns (issues, suggestions, patterns, context)"""
+        # treat anything unknown as object/mechanism
+        check, context_key = self._SCENARIO_CHECKS.get(category) or self._SCENARIO_CHECKS["object"]
+        issues, sugg, pats = check(self, scenario)
+        return tuple(issues), tuple(sugg), pats, (self.context_templates[context_key],)
+
+    def _validate_enemy_scenario(self, s: str) -> Tuple[List[str], List[str], Tuple[str, ...]]:
+        issues, sugg = [], []
         
         # Check for non-existent functions/constants
         self._check_nonexistent_patterns(s, issues, sugg)
         
         # More flexible validation for actor creation scenarios
-        actor_keywords = ["actor", "enemy", "boss", "attack", "damage", "state", "create", "implement", "build"]
-        has_actor_content = any(keyword in s.lower() for keyword in actor_keywords)
+        lowered = s.lower()
+        has_actor_content = any(keyword in lowered for keyword in _ACTOR_KEYWORDS)
         
         if not has_actor_content:
             issues.append("Scenario does not mention concrete actor/enemy behaviour")
             sugg.append("Describe the actor's behavior, states, or goals (e.g., 'charges player when low health', 'creates a switch that activates when player stands on it')")
         
-        pats.extend([
-            "Use Actor_WorldDistXZToActor for distance checks",
-            "State machine via `actionState` field",
-            "Damage via Actor_ApplyDamage + Enemy_StartFinishingBlow",
-            "Collision with Collider_InitCylinder + CollisionCheck_SetAC",
-            "Animation with SkelAnime_InitFlex + SkelAnime_Update",
-        ])
-        return issues, sugg, pats
+        return issues, sugg, _ENEMY_PATTERNS
 
-    def _validate_npc_scenario(self, s: str) -> Tuple[List[str], List[str], List[str]]:
-        issues, sugg, pats = [], [], []
+    def _validate_npc_scenario(self, s: str) -> Tuple[List[str], List[str], Tuple[str, ...]]:
+        issues, sugg = [], []
         
         # Check for non-existent patterns
         self._check_nonexistent_patterns(s, issues, sugg)
         
-        if "dialog" not in s.lower() and "shop" not in s.lower():
+        lowered = s.lower()
+        if "dialog" not in lowered and "shop" not in lowered:
             sugg.append("Mention dialogue, shop or quest behaviour to clarify NPC role")
-        pats.extend([
-            "Dialogue via Npc_UpdateTalking and TEXT_STATE_CLOSING",
-            "Tracking with NpcInteractInfo structure",
-            "Text IDs handled in GetTextId function",
-        ])
-        return issues, sugg, pats
-
-    def _validate_item_scenario(self, s: str) -> Tuple[List[str], List[str], List[str]]:
-        issues, sugg, pats = [], [], []
+        return issues, sugg, _NPC_PATTERNS
+
+    def _validate_item_scenario(self, s: str) -> Tuple[List[str], List[str], Tuple[str, ...]]:
+        issues, sugg = [], []
         
         # Check for non-existent patterns
         self._check_nonexistent_patterns(s, issues, sugg)
         
-        if not re.search(r"item|rupee|heart|key|mask", s, re.I):
+        if not _mentions_any(s, _ITEM_WORDS, _ITEM_RE):
             issues.append("Missing explicit item type")
-        pats.append("Spawn with EnItem00 and ITEM00_* params")
-        pats.extend([
-            "Use EnItem00 for collectibles",
-            "ITEM00_* constants for types",
-            "Bobbing animation via Math_SinS",
-        ])
-        return issues, sugg, pats
-
-    def _validate_object_scenario(self, s: str) -> Tuple[List[str], List[str], List[str]]:
-        issues, sugg, pats = [], [], []
+        return issues, sugg, _ITEM_PATTERNS
+
+    def _validate_object_scenario(self, s: str) -> Tuple[List[str], List[str], Tuple[str, ...]]:
+        issues, sugg = [], []
         
         # Check for non-existent patterns
         self._check_nonexistent_patterns(s, issues, sugg)
         
-        if not re.search(r"switch|platform|door|mechanism|puzzle", s, re.I):
+        if not _mentions_any(s, _OBJECT_WORDS, _OBJECT_RE):
             sugg.append("Specify mechanism type (switch, platform, door, etc.)")
-        pats.extend([
-            "Use DynaPolyActor for moving/mechanic objects",
-            "Switch state toggled with Flags_Get/SetSwitch",
-            "Movement with Math_ApproachF",
-            "Collision via DynaPoly_SetBgActor",
-        ])
-        return issues, sugg, pats
+        return issues, sugg, _OBJECT_PATTERNS
+
+    # category -> (scenario check, context template key)
+    _SCENARIO_CHECKS = {
+        "enemy": (_validate_enemy_scenario, "enemy"),
+        "npc": (_validate_npc_scenario, "npc"),
+        "item": (_validate_item_scenario, "item"),
+        "object": (_validate_object_scenario, "object"),
+    }
 
     def _check_nonexistent_patterns(self, text: str, issues: List[str], suggestions: List[str]) -> None:
         """Check for non-existent functions, constants, and patterns using dynamic authentic sets, but skip user-defined symbols."""
@@ -411,99 +623,86 @@ Return exactly this JSON:
         user_defined_consts = set()
         user_defined_types = set()
 
+        # Each structural pass below needs a literal that plain scenario text
+        # rarely has, so skip the passes that cannot match
+        has_define = "#define" in text
+        has_typedef = "typedef" in text
+        has_enum = "enum" in text
+
         # Function definitions (static or global)
-        func_def_pattern = re.compile(r'^[ \t]*(?:static[ \t]+)?(?:[A-Za-z_][A-Za-z0-9_\* ]+)[ \t]+([A-Za-z_][A-Za-z0-9_]*)\s*\([^)]*\)\s*\{', re.MULTILINE)
-        for match in func_def_pattern.finditer(text):
-            user_defined_funcs.add(match.group(1))
+        if "{" in text:
+            for match in _FUNC_DEF_PATTERN.finditer(text):
+                user_defined_funcs.add(match.group(1))
 
         # Macro/constant definitions - IMPROVED to catch more patterns
-        macro_pattern = re.compile(r'^\s*#define\s+([A-Za-z_][A-Za-z0-9_]*)', re.MULTILINE)
-        for match in macro_pattern.finditer(text):
-            user_defined_consts.add(match.group(1))
+        if has_define:
+            for match in _MACRO_PATTERN.finditer(text):
+                user_defined_consts.add(match.group(1))
             
         # Also catch constants defined in #define macros that reference other constants
-        macro_ref_pattern = re.compile(r'#define\s+([A-Z][A-Z0-9_]*)\s*\([^)]*\)')
-        for match in macro_ref_pattern.finditer(text):
-            user_defined_consts.add(match.group(1))
+        if has_define:
+            for match in _MACRO_REF_PATTERN.finditer(text):
+                user_defined_consts.add(match.group(1))
 
         # Typedef struct/enum/union
-        typedef_pattern = re.compile(r'typedef\s+(?:struct|enum|union)\s*\w*\s*\{[^}]+\}\s*([A-Za-z_][A-Za-z0-9_]*);', re.DOTALL)
-        for match in typedef_pattern.finditer(text):
-            user_defined_types.add(match.group(1))
+        if has_typedef:
+            for match in _TYPEDEF_PATTERN.finditer(text):
+                user_defined_types.add(match.group(1))
 
         # Extract enum values from enum definitions - IMPROVED
-        enum_pattern = re.compile(r'typedef\s+enum\s*\w*\s*\{([^}]+)\}', re.DOTALL)
-        for match in enum_pattern.finditer(text):
+        for match in (_TYPEDEF_ENUM_PATTERN.finditer(text) if has_typedef and has_enum else ()):
             enum_body = match.group(1)
             # Extract enum values (lines that look like constants)
             for line in enum_body.split('\n'):
                 line = line.strip()
                 if line and not line.startswith('/*') and not line.startswith('//'):
                     # Extract constant name (before comma or comment)
-                    const_match = re.match(r'([A-Z][A-Z0-9_]*)\s*(?:,|$)', line)
+                    const_match = _ENUM_CONSTANT_PATTERN.match(line)
                     if const_match:
                         user_defined_consts.add(const_match.group(1))
 
         # Extract enum values from inline enum definitions - IMPROVED
-        inline_enum_pattern = re.compile(r'enum\s*\w*\s*\{([^}]+)\}', re.DOTALL)
-        for match in inline_enum_pattern.finditer(text):
+        for match in (_INLINE_ENUM_PATTERN.finditer(text) if has_enum else ()):
             enum_body = match.group(1)
             for line in enum_body.split('\n'):
                 line = line.strip()
                 if line and not line.startswith('/*') and not line.startswith('//'):
-                    const_match = re.match(r'([A-Z][A-Z0-9_]*)\s*(?:,|$)', line)
+                    const_match = _ENUM_CONSTANT_PATTERN.match(line)
                     if const_match:
                         user_defined_consts.add(const_match.group(1))
 
         # Extract constants from enum definitions without typedef
-        enum_def_pattern = re.compile(r'enum\s+[A-Za-z_][A-Za-z0-9_]*\s*\{([^}]+)\}', re.DOTALL)
-        for match in enum_def_pattern.finditer(text):
+        for match in (_NAMED_ENUM_PATTERN.finditer(text) if has_enum else ()):
             enum_body = match.group(1)
             for line in enum_body.split('\n'):
                 line = line.strip()
                 if line and not line.startswith('/*') and not line.startswith('//'):
-                    const_match = re.match(r'([A-Z][A-Z0-9_]*)\s*(?:,|$)', line)
+                    const_match = _ENUM_CONSTANT_PATTERN.match(line)
                     if const_match:
                         user_defined_consts.add(const_match.group(1))
 
         # Extract constants from #define statements with values
-        define_value_pattern = re.compile(r'#define\s+([A-Z][A-Z0-9_]*)\s+[^\n]+')
-        for match in define_value_pattern.finditer(text):
-            user_defined_consts.add(match.group(1))
+        if has_define:
+            for match in _DEFINE_VALUE_PATTERN.finditer(text):
+                user_defined_consts.add(match.group(1))
 
         # Extract constants from const declarations
-        const_decl_pattern = re.compile(r'const\s+[A-Za-z_][A-Za-z0-9_]*\s+([A-Z][A-Z0-9_]*)\s*=')
-        for match in const_decl_pattern.finditer(text):
-            user_defined_consts.add(match.group(1))
+        if "const" in text:
+            for match in _CONST_DECL_PATTERN.finditer(text):
+                user_defined_consts.add(match.group(1))
 
-        # Extract constants from static const declarations
-        static_const_pattern = re.compile(r'static\s+const\s+[A-Za-z_][A-Za-z0-9_]*\s+([A-Z][A-Z0-9_]*)\s*=')
-        for match in static_const_pattern.finditer(text):
-            user_defined_consts.add(match.group(1))
+            # Extract constants from static const declarations
+            for match in _STATIC_CONST_PATTERN.finditer(text):
+                user_defined_consts.add(match.group(1))
 
         # --- Extract function calls ---
-        func_pattern = re.compile(r'\b([A-Z][A-Za-z0-9_]*)\s*\(')
-        found_funcs = set(match.group(1) for match in func_pattern.finditer(text))
+        found_funcs = set(match.group(1) for match in _FUNC_CALL_PATTERN.finditer(text))
 
         # --- Extract all-caps constants ---
-        const_pattern = re.compile(r'\b([A-Z][A-Z0-9_]{2,})\b')
-        found_consts = set(match.group(1) for match in const_pattern.finditer(text))
+        found_consts = set(match.group(1) for match in _CONSTANT_PATTERN.finditer(text))
 
         # Known C keywords and builtins to ignore
-        c_keywords = set(keyword.kwlist) | set(dir(builtins)) | {
-            'NULL', 'TRUE', 'FALSE', 'bool', 'int', 'float', 'double', 'char', 'void', 'size_t',
-            'u8', 'u16', 'u32', 's8', 's16', 's32', 'f32', 'f64', 'uintptr_t', 'intptr_t',
-            'struct', 'enum', 'union', 'typedef', 'const', 'static', 'extern', 'volatile',
-            'register', 'unsigned', 'signed', 'short', 'long', 'inline', 'restrict',
-            'if', 'else', 'for', 'while', 'do', 'switch', 'case', 'break', 'continue', 'goto', 'return',
-            'sizeof', 'offsetof',
-            # Common C functions that should not be flagged
-            'CLAMP', 'MIN', 'MAX', 'ABS', 'SIGN', 'ROUND', 'FLOOR', 'CEIL',
-            'sin', 'cos', 'tan', 'asin', 'acos', 'atan', 'sinh', 'cosh', 'tanh',
-            'exp', 'log', 'log10', 'pow', 'sqrt', 'fabs', 'floor', 'ceil',
-            'malloc', 'free', 'calloc', 'realloc', 'memcpy', 'memmove', 'memset',
-            'strcpy', 'strcat', 'strcmp', 'strlen', 'strchr', 'strstr',
-        }
+        c_keywords = _C_KEYWORDS
 
         # --- Check functions ---
         for func in found_funcs:
@@ -551,21 +750,7 @@ Return exactly this JSON:
                 continue
                 
             # Skip common romhacking constants that are user-defined
-            romhacking_constants = {
-                'COLTYPE_NONE', 'COLTYPE_HIT1', 'COLTYPE_HIT2', 'COLTYPE_HIT3',
-                'COLSHAPE_CYLINDER', 'COLSHAPE_SPHERE', 'COLSHAPE_BOX', 'COLSHAPE_TRIS',
-                'ELEMTYPE_UNK0', 'ELEMTYPE_UNK1', 'ELEMTYPE_UNK2', 'ELEMTYPE_UNK3',
-                'TOUCH_NONE', 'TOUCH_ON', 'BUMP_ON', 'BUMP_NONE',
-                'OC_ON', 'OC_NONE', 'OCELEM_ON', 'OCELEM_NONE',
-                'AT_NONE', 'AT_ON', 'AC_ON', 'AC_NONE',
-                'ACTORCAT_ENEMY', 'ACTORCAT_NPC', 'ACTORCAT_MISC', 'ACTORCAT_ITEMACTION',
-                'ACTOR_FLAG_0', 'ACTOR_FLAG_1', 'ACTOR_FLAG_2', 'ACTOR_FLAG_3', 'ACTOR_FLAG_4', 'ACTOR_FLAG_5',
-                'MASS_IMMOVABLE', 'MASS_50', 'MASS_40', 'MASS_30',
-                'OBJECT_GAMEPLAY_KEEP', 'OBJECT_GAMEPLAY_DANGEON_KEEP',
-                'UPDBGCHECKINFO_FLAG_0', 'UPDBGCHECKINFO_FLAG_2', 'UPDBGCHECKINFO_FLAG_4',
-                'FLAGS_NONE', 'FLAGS_0', 'FLAGS_1', 'FLAGS_2', 'FLAGS_3', 'FLAGS_4', 'FLAGS_5'
-            }
-            if const in romhacking_constants:
+            if const in _ROMHACKING_CONSTANTS:
                 continue  # These are commonly used in romhacking and should not be flagged
                 
             const_norm = const.lower()
@@ -1194,105 +1379,6 @@ Return exactly this JSON:
 
     # ------------------------ context templates -------------
 
-    def _build_context_templates(self) -> Dict[str, str]:
-        tpl = {}
-        tpl["enemy"] = (
-            "AUTHENTIC ENEMY PATTERNS:\n"
-            "- Collider_InitCylinder for body\n"
-            "- actionState enum controlling AI\n"
-            "- Damage handled with Actor_ApplyDamage\n"
-            "- Distance checks via Actor_WorldDistXZToActor\n"
-            "- Use Actor_PlaySfx for sound effects\n"
-            "- State machine with actionFunc pointer\n"
-            "- REQUIRED: ActorProfile struct at end\n"
-            "- REQUIRED: ColliderCylinderInit static struct\n"
-            "- REQUIRED: Proper struct with Actor as first field\n"
-            "- REQUIRED: Function signatures (Actor* thisx, PlayState* play)\n"
-            "\n🚨 CRITICAL WARNINGS:\n"
-            "✗ NEVER use Gfx_DrawDListOpa(play, gSomeDL) - this function doesn't exist\n"
-            "✗ NEVER directly manipulate player->actor.world.pos or player->actor.velocity\n"
-            "✗ NEVER access player->health or player->healthCapacity\n"
-            "✗ NEVER use SkelAnime functions without declaring SkelAnime in struct\n"
-            "✗ NEVER use ACTOR_FLAG_8 or other non-existent flags\n"
-            "✓ Use SkelAnime_DrawOpa(play, this->skelAnime.skeleton, this->skelAnime.jointTable, NULL, NULL, this)\n"
-            "✓ Use gSaveContext.health and gSaveContext.healthCapacity for player health\n"
-            "✓ Use proper flag checking: if (this->actor.flags & ACTOR_FLAG_0)\n"
-            "✓ Declare SkelAnime skelAnime; in struct if using skeleton animation"
-        )
-        tpl["npc"] = (
-            "AUTHENTIC NPC PATTERNS:\n"
-            "- Dialogue via Npc_UpdateTalking\n"
-            "- Text IDs handled in GetTextId function\n"
-            "- Tracking player with NpcInteractInfo\n"
-            "- Use Actor_PlaySfx for sound effects\n"
-            "- State machine with actionFunc pointer\n"
-            "- REQUIRED: ActorProfile struct at end\n"
-            "- REQUIRED: ColliderCylinderInit static struct\n"
-            "- REQUIRED: Proper struct with Actor as first field\n"
-            "- REQUIRED: Function signatures (Actor* thisx, PlayState* play)\n"
-            "\n🚨 CRITICAL WARNINGS:\n"
-            "✗ NEVER use Gfx_DrawDListOpa(play, gSomeDL) - this function doesn't exist\n"
-            "✗ NEVER directly manipulate player->actor.world.pos or player->actor.velocity\n"
-            "✗ NEVER access player->health or player->healthCapacity\n"
-            "✗ NEVER use SkelAnime functions without declaring SkelAnime in struct\n"
-            "✗ NEVER use ACTOR_FLAG_8 or other non-existent flags\n"
-            "✓ Use SkelAnime_DrawOpa(play, this->skelAnime.skeleton, this->skelAnime.jointTable, NULL, NULL, this)\n"
-            "✓ Use gSaveContext.health and gSaveContext.healthCapacity for player health\n"
-            "✓ Use proper flag checking: if (this->actor.flags & ACTOR_FLAG_0)\n"
-            "✓ Declare SkelAnime skelAnime; in struct if using skeleton animation"
-        )
-        tpl["item"] = (
-            "AUTHENTIC ITEM PATTERNS:\n"
-            "- Use EnItem00 for collectibles\n"
-            "- ITEM00_* constants for types\n"
-            "- Bobbing animation via Math_SinS\n"
-            "- Use Actor_PlaySfx for sound effects\n"
-            "- Collision with Collider_InitCylinder\n"
-            "- REQUIRED: ActorProfile struct at end\n"
-            "- REQUIRED: ColliderCylinderInit static struct\n"
-            "- REQUIRED: Proper struct with Actor as first field\n"
-            "- REQUIRED: Function signatures (Actor* thisx, PlayState* play)\n"
-            "\n🚨 CRITICAL WARNINGS:\n"
-            "✗ NEVER use Gfx_DrawDListOpa(play, gSomeDL) - this function doesn't exist\n"
-            "✗ NEVER directly manipulate player->actor.world.pos or player->actor.velocity\n"
-            "✗ NEVER access player->health or player->healthCapacity\n"
-            "✗ NEVER use SkelAnime functions without declaring SkelAnime in struct\n"
-            "✗ NEVER use ACTOR_FLAG_8 or other non-existent flags\n"
-            "✓ Use SkelAnime_DrawOpa(play, this->skelAnime.skeleton, this->skelAnime.jointTable, NULL, NULL, this)\n"
-            "✓ Use gSaveContext.health and gSaveContext.healthCapacity for player health\n"
-            "✓ Use proper flag checking: if (this->actor.flags & ACTOR_FLAG_0)\n"
-            "✓ Declare SkelAnime skelAnime; in struct if using skeleton animation"
-        )
-        tpl["object"] = (
-            "AUTHENTIC OBJECT PATTERNS:\n"
-            "- Mechanics via DynaPolyActor\n"
-            "- Switch state toggled with Flags_Get/SetSwitch\n"
-            "- Movement with Math_ApproachF\n"
-            "- Use Actor_PlaySfx for sound effects\n"
-            "- Collision via DynaPoly_SetBgActor\n"
-            "- REQUIRED: ActorProfile struct at end\n"
-            "- REQUIRED: ColliderCylinderInit static struct\n"
-            "- REQUIRED: Proper struct with Actor as first field\n"
-            "- REQUIRED: Function signatures (Actor* thisx, PlayState* play)\n"
-            "- AUTHENTIC PATTERNS ONLY:\n"
-            "  ✓ Use Actor_WorldDistXZToActor(&this->actor, &player->actor) for distance\n"
-            "  ✓ Use SkelAnime_DrawOpa() or Gfx_DrawDListOpa() for drawing\n"
-            "  ✓ Use if (gSaveContext.inventory.items[SLOT_HOOKSHOT] != ITEM_NONE) for items\n"
-            "  ✓ Use Actor_Spawn(&play->actorCtx, play, ACTOR_EN_ITEM00, ...) for spawning\n"
-            "  ✗ NEVER use fabricated patterns like INV_CONTENT(), Actor_DrawOpa(), etc.\n"
-            "\n🚨 CRITICAL WARNINGS:\n"
-            "✗ NEVER use Gfx_DrawDListOpa(play, gSomeDL) - this function doesn't exist\n"
-            "✗ NEVER directly manipulate player->actor.world.pos or player->actor.velocity\n"
-            "✗ NEVER access player->health or player->healthCapacity\n"
-            "✗ NEVER use SkelAnime functions without declaring SkelAnime in struct\n"
-            "✗ NEVER use ACTOR_FLAG_8 or other non-existent flags\n"
-            "✓ Use SkelAnime_DrawOpa(play, this->skelAnime.skeleton, this->skelAnime.jointTable, NULL, NULL, this)\n"
-            "✓ Use gSaveContext.health and gSaveContext.healthCapacity for player health\n"
-            "✓ Use proper flag checking: if (this->actor.flags & ACTOR_FLAG_0)\n"
-            "✓ Declare SkelAnime skelAnime; in struct if using skeleton animation"
-        )
-        return tpl
-
     def _get_oot_pattern_examples(self, category: str) -> str:
         """Get OoT pattern examples for the given category."""
         examples = {
@@ -1896,6 +1982,24 @@ const ActorProfile ObjSwitch_Profile = {
                 issues.append("CRITICAL: Missing authentic drawing function")
                 suggestions.append("Use SkelAnime_DrawOpa() for skeleton animation or Gfx_DrawDListOpa() for display lists")
 
+# ------------------------------------------------------------
+# Shared prompt cache
+# ------------------------------------------------------------
+
+@lru_cache(maxsize=None)
+def _default_validator() -> OoTPatternValidator:
+    return OoTPatternValidator()
+
+@lru_cache(maxsize=8192)
+def cached_enhanced_prompt(scenario: str, category: str) -> str:
+    """Validate and build the enhanced prompt once per (scenario, category).
+
+    Retries of the same request get the stored prompt back; hit/miss counts
+    are available from cached_enhanced_prompt.cache_info().
+    """
+    validator = _default_validator()
+    return validator.create_enhanced_prompt(scenario, category, validator.validate_scenario(scenario, category))
+
 # ------------------------------------------------------------
 # Simple CLI test
 # ------------------------------------------------------------
@@ -281,17 +281,26 @@ class DynamicSourceAnalyzer:
             if name.startswith(prefix)
         }
     
-    def validate_against_real_source(self, code: str) -> List[str]:
-        """Validate code against real source patterns"""
+    def validate_against_real_source(self, code: str, function_names: Optional[List[str]] = None) -> List[str]:
+        """Validate code against real source patterns
+        
+        function_names lets a caller that already scanned the code for calls
+        pass the candidate names (keywords, g* and macros already removed).
+        """
         issues = []
         
         # Check if functions used exist in real source
-        func_pattern = r'(\w+)\s*\('
-        for match in re.finditer(func_pattern, code):
-            func_name = match.group(1)
-            if (func_name not in ['if', 'for', 'while', 'switch', 'sizeof', 'typedef'] and
-                not func_name.startswith('g') and not func_name.isupper() and
-                len(func_name) > 3 and func_name not in self.real_functions):
+        if function_names is None:
+            func_pattern = r'(\w+)\s*\('
+            function_names = []
+            for match in re.finditer(func_pattern, code):
+                func_name = match.group(1)
+                if (func_name not in ['if', 'for', 'while', 'switch', 'sizeof', 'typedef'] and
+                    not func_name.startswith('g') and not func_name.isupper() and
+                    len(func_name) > 3):
+                    function_names.append(func_name)
+        for func_name in function_names:
+            if func_name not in self.real_functions:
                 issues.append(f"Function '{func_name}' not found in real OoT source")
         
         # Check if structs used exist
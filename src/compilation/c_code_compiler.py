@@ -62,6 +62,14 @@ class CCodeExtractor:
     
     def extract_c_code(self, text: str) -> List[str]:
         """Extract C code snippets from text"""
+        # Every pattern below needs a code fence or one of these keywords. The
+        # lowercase check is only exact for ASCII text; IGNORECASE also folds
+        # characters like the long s.
+        if text.isascii():
+            lowered = text.lower()
+            if not any(marker in lowered for marker in ("```", "typedef", "void", "static")):
+                return []
+        
         snippets = []
         
         # First try to extract complete code blocks with ```c or ``` markers
@@ -5,14 +5,44 @@ Strict Authenticity Validator for OoT Training Data
 
 import re
 import os
+import math
+import string
 import json
-from typing import List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from dataclasses import dataclass, replace
+from functools import cached_property
 
 from src.core.logger import logger
 from src.analyzers.source_analyzer import DynamicSourceAnalyzer
 from .function_signature_validator import FunctionSignatureValidator
-from src.compilation.c_code_compiler import CCodeExtractor, CompilationResult
+from src.compilation.c_code_compiler import CCodeExtractor, CompilationResult, OoTCompiler
+
+try:
+    import ahocorasick  # Optional: finds all literal patterns in one pass
+except ImportError:
+    ahocorasick = None
+
+# Number of recent inputs each validator cache remembers
+_CACHE_SIZE = 1024
+
+# Call-like keywords that are never OoT functions
+_NON_FUNCTION_KEYWORDS = frozenset({'if', 'for', 'while', 'switch', 'sizeof', 'typedef'})
+
+# Struct bodies declared with typedef, searched for member declarations
+_TYPEDEF_STRUCT_PATTERN = re.compile(r'typedef\s+struct\s*\{[^}]*\}', re.DOTALL)
+_SKELETON_TABLES_STRUCT_PATTERN = re.compile(
+    r'typedef\s+struct\s*\{(?=[^}]*jointTable)(?=[^}]*morphTable)[^}]*\}', re.DOTALL
+)
+
+# Wrong parameter order in actor lifecycle functions. The fused pattern finds
+# whether any occur in one search; the per-function patterns count which do.
+_WRONG_ORDER_ANY_PATTERN = re.compile(r"void\s+\w+_(?:Init|Update|Destroy|Draw)\(PlayState\*[^,]*,\s*Actor\*")
+_WRONG_ORDER_PATTERNS = [
+    re.compile(r"void\s+\w+_Init\(PlayState\*[^,]*,\s*Actor\*"),
+    re.compile(r"void\s+\w+_Update\(PlayState\*[^,]*,\s*Actor\*"),
+    re.compile(r"void\s+\w+_Destroy\(PlayState\*[^,]*,\s*Actor\*"),
+    re.compile(r"void\s+\w+_Draw\(PlayState\*[^,]*,\s*Actor\*"),
+]
 
 
 @dataclass
@@ -25,257 +55,647 @@ class ValidationResult:
     compilation_result: Optional[CompilationResult] = None
 
 
+@dataclass
+class _CodeAnalysis:
+    """Pattern hits for one piece of code, shared by the validation methods"""
+    wrong_order_hits: int
+    uses_global_context: bool
+    forbidden_hits: List[str]
+    critical_hits: int
+    call_names: List[str]
+    unknown_calls: List[str]
+    source_issues: List[str]
+    feedback_issues: List[str]
+
+
+def _compile_correction_passes(corrections: Dict[str, str]) -> List[Tuple["re.Pattern", Callable]]:
+    """Fold an ordered literal correction table into single-pass regex substitutions.
+
+    Applying the table in order means an entry also sees the output of every
+    entry before it. Each replacement is therefore chained through the entries
+    that follow it, and entries whose output can form a later key (e.g.
+    globalCtx -> play ahead of OPEN_DISPS(play->state.gfxCtx)) get a pass of
+    their own so the result matches the sequential str.replace loop.
+    """
+    keys = list(corrections)
+    chained = {}
+    for i, key in enumerate(keys):
+        value = corrections[key]
+        for later in keys[i + 1:]:
+            value = value.replace(later, corrections[later])
+        chained[key] = value
+
+    feeding = {}
+    remaining = {}
+    for i, key in enumerate(keys):
+        if any(chained[key] in later for later in keys[i + 1:]):
+            feeding[key] = corrections[key]
+        elif chained[key] != key:
+            remaining[key] = chained[key]
+
+    passes = []
+    for table in (feeding, remaining):
+        if table:
+            # Longest first so "const ActorInit" wins over "ActorInit"
+            alternation = "|".join(re.escape(k) for k in sorted(table, key=len, reverse=True))
+            passes.append((re.compile(alternation), lambda match, table=table: table[match.group()]))
+    return passes
+
+
+def _scan_call_names(code: str) -> List[str]:
+    """Names of candidate function calls in code, in order of appearance.
+
+    Equivalent to the (\w+)\s*\( regex scan: every '(' is located with
+    str.find and the identifier in front of it is read backwards. Keywords,
+    display lists (g*), macros (all caps) and short names are left out.
+    """
+    names = []
+    start = 0
+    while True:
+        paren = code.find("(", start)
+        if paren < 0:
+            return names
+        end = paren
+        while end > start and code[end - 1].isspace():
+            end -= 1
+        begin = end
+        while begin > start and (code[begin - 1].isalnum() or code[begin - 1] == "_"):
+            begin -= 1
+        name = code[begin:end]
+        if (len(name) > 3 and
+            name not in _NON_FUNCTION_KEYWORDS and
+            not name.startswith('g') and not name.isupper()):
+            names.append(name)
+        start = paren + 1
+
+
+def _remember(cache: dict, key, value):
+    """Store a result in a bounded cache, evicting the oldest entry when full"""
+    if len(cache) >= _CACHE_SIZE:
+        cache.pop(next(iter(cache)))
+    cache[key] = value
+    return value
+
+
+def _typedef_structs(code: str):
+    """Iterate over typedef struct bodies in code, skipping the regex when there can be none"""
+    if "typedef" not in code or "struct" not in code:
+        return iter(())
+    return (match.group(0) for match in _TYPEDEF_STRUCT_PATTERN.finditer(code))
+
+
+def _literal_alternatives(pattern: str) -> Optional[List[str]]:
+    """The literal strings a pattern is an alternation of, or None for a real regex.
+
+    Escaped punctuation such as play->msgCtx\\.choiceIndex counts as literal text.
+    """
+    alternatives = []
+    current = []
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\":
+            if i + 1 == len(pattern) or pattern[i + 1] not in string.punctuation:
+                return None  # \s, \w, \d and friends
+            current.append(pattern[i + 1])
+            i += 2
+            continue
+        if ch == "|":
+            alternatives.append("".join(current))
+            current = []
+        elif ch in ".^$*+?{}[]()":
+            return None
+        else:
+            current.append(ch)
+        i += 1
+    alternatives.append("".join(current))
+    if not all(alternatives):
+        return None
+    return alternatives
+
+
+class _LiteralScanner:
+    """Finds which of a fixed set of literal strings occur in code.
+
+    Uses an Aho-Corasick automaton when pyahocorasick is installed, so the
+    code is walked once however many literals there are; otherwise each
+    literal gets a substring test.
+    """
+
+    def __init__(self, literals: Iterable[str]):
+        self.literals = tuple(dict.fromkeys(literals))
+        self._automaton = None
+        if ahocorasick is not None and self.literals:
+            self._automaton = ahocorasick.Automaton()
+            for literal in self.literals:
+                self._automaton.add_word(literal, literal)
+            self._automaton.make_automaton()
+
+    def present(self, code: str) -> Set[str]:
+        if self._automaton is None:
+            return {literal for literal in self.literals if literal in code}
+        return {literal for _, literal in self._automaton.iter(code)}
+
+    def contains_any(self, code: str) -> bool:
+        if self._automaton is None:
+            return any(literal in code for literal in self.literals)
+        return next(self._automaton.iter(code), None) is not None
+
+
+def _pattern_matcher(pattern: str):
+    """Return a callable telling whether code contains the pattern.
+
+    Most patterns are plain identifiers or member paths (or alternations of
+    them) and are checked with a substring test; only real regexes go
+    through re.
+    """
+    alternatives = _literal_alternatives(pattern)
+    if alternatives is not None:
+        if len(alternatives) == 1:
+            literal = alternatives[0]
+            return lambda code: literal in code
+        return lambda code: any(alt in code for alt in alternatives)
+    return re.compile(pattern).search
+
+
+def _any_pattern_matcher(patterns: List[str]):
+    """Return a callable telling whether code contains any of the patterns.
+
+    Literal patterns go to a _LiteralScanner and the real regexes are fused
+    into one alternation, so code goes through re at most once per call.
+    """
+    literals = []
+    regexes = []
+    for pattern in patterns:
+        alternatives = _literal_alternatives(pattern)
+        if alternatives is None:
+            regexes.append(pattern)
+        else:
+            literals.extend(alternatives)
+    contains_literal = _LiteralScanner(literals).contains_any
+    if not regexes:
+        return contains_literal
+    search = re.compile("|".join(f"(?:{pattern})" for pattern in regexes)).search
+    return lambda code: contains_literal(code) or search(code) is not None
+
+
+def _critical_checks_over(critical_patterns: Tuple[str, ...], forbidden_patterns: Tuple[str, ...]):
+    """Pair each critical pattern with the forbidden patterns it is made of.
+
+    A critical pattern that is a forbidden pattern, or an alternation of
+    forbidden patterns, hits exactly when one of those does, so it can be
+    read off the forbidden hits instead of scanning the code again. Any
+    other critical pattern keeps its own matcher.
+    """
+    forbidden = set(forbidden_patterns)
+    checks = []
+    for pattern in critical_patterns:
+        alternatives = pattern.split("|")
+        if all(alt in forbidden for alt in alternatives):
+            checks.append((alternatives, None))
+        else:
+            checks.append((None, _pattern_matcher(pattern)))
+    return checks
+
+
+def _ignorecase_matcher(patterns: List[str]):
+    """Case-insensitive any-of matcher over ASCII-only patterns.
+
+    Callers pass a lowercased copy of ASCII code, which is matched with a
+    case-sensitive regex; other code keeps full IGNORECASE semantics.
+    """
+    lowered = re.compile("|".join(p.lower() for p in patterns))
+    folded = re.compile("|".join(patterns), re.IGNORECASE)
+
+    def matches(code: str, code_lower: Optional[str]) -> bool:
+        if code_lower is not None:
+            return lowered.search(code_lower) is not None
+        return folded.search(code) is not None
+
+    return matches
+
+
+# Majora's Mask mechanics that leak into generated OoT code
+_MAJORAS_MASK_MATCHER = _ignorecase_matcher([
+    r'TRANSFORM_STATE_DEKU', r'TRANSFORM_STATE_GORON', r'TRANSFORM_STATE_ZORA',
+    r'transformState', r'transformTimer', r'transformation',
+    r'Deku\s+form', r'Goron\s+form', r'Zora\s+form'
+])
+
+# Dynamic memory allocation, which actors must not use
+_MEMORY_ALLOCATION_MATCHER = _ignorecase_matcher([
+    r'ZeldaArena_Malloc\s*\(',
+    r'malloc\s*\(',
+    r'dynamic\s+memory\s+allocation',
+    r'memory\s+manager'
+])
+
+# Calls to functions that were made up by the generator
+_FABRICATED_FUNCTION_PATTERNS = [re.compile(p) for p in [
+    r'Gfx_DrawDListOpa\s*\(\s*play,\s*[^)]+\s*\)',
+    r'Actor_DrawOpa\s*\(\s*play,\s*[^)]+\s*\)',
+    r'func_80093D18\s*\(',
+    r'ZeldaArena_MallocDebug\s*\(',
+    r'ZeldaArena_FreeDebug\s*\(',
+]]
+
+# Debug-build call forms that do not exist in the retail API
+_MATRIX_NEWMTX_STRING_PATTERN = re.compile(r'Matrix_NewMtx\s*\(\s*[^,]+,\s*"[^"]+"\s*\)')
+_OPEN_DISPS_FILE_LINE_PATTERN = re.compile(r'OPEN_DISPS\s*\(\s*[^,]+,\s*"[^"]+",\s*[^)]+\)')
+_SMOOTHSTEP_ASSIGNMENT_PATTERN = re.compile(r'[a-zA-Z_][a-zA-Z0-9_]*\s*=\s*Math_SmoothStepToF\s*\(')
+
+# Collision calls that need a ColliderCylinder member declared
+_COLLIDER_CALLS = ('Collider_InitCylinder', 'Collider_UpdateCylinder', 'CollisionCheck_SetOC', 'CollisionCheck_SetAC')
+_COLLIDER_DECLARATION = 'ColliderCylinder collider'
+
+# Table-driven code checks: one issue when any of a check's patterns occurs.
+# Every pattern of a check contains one of its tripwire strings, so a check
+# whose tripwires are all absent is skipped without running its regexes.
+_CODE_CHECKS = {
+    "player_health": (
+        ("player->",),
+        [
+            r'player->health',
+            r'player->healthCapacity',
+            r'player->maxHealth',
+            r'player->currentHealth',
+        ],
+        "❌ CRITICAL: Wrong player health access - player->health doesn't exist in OoT",
+    ),
+    "player_position": (
+        ("player->actor.",),
+        [
+            r'player->actor\.world\.pos\.x\s*[+\-]?=',
+            r'player->actor\.world\.pos\.y\s*[+\-]?=',
+            r'player->actor\.world\.pos\.z\s*[+\-]?=',
+            r'player->actor\.world\.pos\s*[+\-]?=',
+            r'player->actor\.world\.rot\.',
+            r'player->actor\.velocity\.',
+            r'player->actor\.speed',
+        ],
+        "❌ CRITICAL: Direct player position/velocity manipulation - OoT never allows other actors to directly manipulate player physics",
+    ),
+    "flag_usage": (
+        ("ACTOR_FLAG_",),
+        [
+            r'CHECK_FLAG_ALL\s*\(\s*player->actor\.flags,\s*ACTOR_FLAG_8\s*\)',
+            r'CHECK_FLAG_ALL\s*\(\s*[^,]+,\s*ACTOR_FLAG_[89]\s*\)',
+            r'ACTOR_FLAG_8',
+            r'ACTOR_FLAG_9',
+            r'ACTOR_FLAG_[89]',
+        ],
+        "❌ CRITICAL: Wrong flag usage - ACTOR_FLAG_8/9 don't exist in OoT",
+    ),
+    "drawing_functions": (
+        ("Gfx_Draw", "Actor_Draw", "Actor_RenderModel"),
+        [
+            r'Gfx_DrawDListOpa\s*\(\s*play,\s*g[A-Z][a-zA-Z0-9_]*DL\s*\)',
+            r'Gfx_DrawDListOpa\s*\(\s*play,\s*[a-z][a-zA-Z0-9_]*DL\s*\)',
+            r'Gfx_DrawDListOpa\s*\(\s*play,\s*[^)]+\s*\)',
+            r'Actor_DrawOpa\s*\(\s*play,\s*[^)]+\s*\)',
+            r'Actor_DrawModel\s*\(\s*play,\s*[^)]+\s*\)',
+            r'Actor_DrawMesh\s*\(\s*play,\s*[^)]+\s*\)',
+            r'Actor_RenderModel\s*\(\s*play,\s*[^)]+\s*\)',
+            r'Actor_DrawScale\s*\(\s*play,\s*[^)]+\s*\)',
+            r'Gfx_DrawDList\s*\(\s*play,\s*[^)]+\s*\)',
+            r'Gfx_DrawModel\s*\(\s*play,\s*[^)]+\s*\)',
+        ],
+        "❌ CRITICAL: Non-existent drawing function - Gfx_DrawDListOpa(play, gSomeDL) doesn't exist in OoT",
+    ),
+}
+
+_CODE_CHECK_MATCHERS = {
+    name: (tripwires, _any_pattern_matcher(patterns), message)
+    for name, (tripwires, patterns, message) in _CODE_CHECKS.items()
+}
+
+
+def _code_check_fails(code: str, tripwires: Tuple[str, ...], matches: Callable[[str], bool]) -> bool:
+    """Whether a table-driven check finds one of its patterns in code"""
+    return any(t in code for t in tripwires) and matches(code)
+
+
 class StrictAuthenticityValidator:
     """Validates authenticity of generated OoT code against real codebase"""
     
+    # Mandatory corrections for authenticity
+    mandatory_corrections = {
+        # Function signature corrections
+        "GlobalContext": "PlayState",
+        "globalCtx": "play",
+        "void ActorName_Init(PlayState* play, Actor* thisx)": "void ActorName_Init(Actor* thisx, PlayState* play)",
+        "void ActorName_Update(PlayState* play, Actor* thisx)": "void ActorName_Update(Actor* thisx, PlayState* play)",
+        "void ActorName_Destroy(PlayState* play, Actor* thisx)": "void ActorName_Destroy(Actor* thisx, PlayState* play)",
+        "void ActorName_Draw(PlayState* play, Actor* thisx)": "void ActorName_Draw(Actor* thisx, PlayState* play)",
+        
+        # Position access corrections (from real decompilation)
+        "this->actor.pos": "this->actor.world.pos",
+        "this->actor.rot": "this->actor.world.rot", 
+        "player->actor.pos": "player->actor.world.pos",
+        
+        # Structure corrections
+        "ActorInit": "ActorProfile",
+        "const ActorInit": "const ActorProfile",
+        
+        # NEW: Feedback-based corrections
+        "play->state.input[0].press.button": "input->press.button",  # Will be used with Input* input = &play->state.input[0]
+        "Actor_DrawScale": "SkelAnime_DrawOpa",  # Replace non-existent drawing functions
+        "Actor_DrawModel": "SkelAnime_DrawOpa",
+        "Actor_DrawMesh": "Gfx_DrawDListOpa",
+        "Actor_RenderModel": "Gfx_DrawDListOpa",
+        "LightContext_InsertLight": "Lights_PointGlowSetInfo",  # Correct lighting function
+        
+        # NEW: Additional feedback-based corrections
+        "SkelAnime_BlendFrames": "Animation_MorphToLoop",  # Replace non-existent animation blending
+        "ANIM_BLEND_MAX_JOINTS": "PLAYER_LIMB_MAX",  # Replace with authentic constant
+        "PLAYER_MASK_13": "PLAYER_MASK_OCARINA",  # Replace with authentic mask
+        "Player_Action_80846978": "Player_UpdateOcarina",  # Replace with authentic function
+        "ENTR_TEMPLE_OF_TIME_0": "ENTR_TEMPLE_OF_TIME",  # Replace with authentic entrance
+        "TRANS_TYPE_FADE_WHITE": "TRANS_TYPE_FADE_BLACK",  # Replace with authentic transition
+        "TRANS_TRIGGER_START": "TRANS_TRIGGER_START",  # Keep but verify usage
+        
+        # NEW: Additional feedback-based corrections
+        "Lights_PointGlowSetInfo": "LightContext_InsertLight",  # Replace with authentic lighting function
+        "Lights_PointNoGlowSetInfo": "LightContext_InsertLight",  # Replace with authentic lighting function
+        "Math_Vec3f_DistXZ": "sqrtf(SQ(dx) + SQ(dz))",  # Replace with manual calculation
+        "BGCHECKFLAG_GROUND": "UPDBGCHECKINFO_FLAG_0 | UPDBGCHECKINFO_FLAG_2",  # Replace with authentic flags
+        
+        # NEW: Updated corrections based on compilation testing
+        "COLTYPE_NONE": "COL_MATERIAL_NONE",
+        "COLTYPE_HIT0": "COL_MATERIAL_HIT0", 
+        "COLTYPE_HIT1": "COL_MATERIAL_HIT1",
+        "COLTYPE_HIT2": "COL_MATERIAL_HIT2",
+        "COLTYPE_HIT3": "COL_MATERIAL_HIT3",
+        "COLTYPE_METAL": "COL_MATERIAL_METAL",
+        "COLTYPE_WOOD": "COL_MATERIAL_WOOD",
+        "COLTYPE_HARD": "COL_MATERIAL_HARD",
+        "COLTYPE_TREE": "COL_MATERIAL_TREE",
+        "ELEMTYPE_UNK0": "ELEM_MATERIAL_UNK0",
+        "ELEMTYPE_UNK1": "ELEM_MATERIAL_UNK1",
+        "ELEMTYPE_UNK2": "ELEM_MATERIAL_UNK2",
+        "ELEMTYPE_UNK3": "ELEM_MATERIAL_UNK3",
+        "ELEMTYPE_UNK4": "ELEM_MATERIAL_UNK4",
+        "ELEMTYPE_UNK5": "ELEM_MATERIAL_UNK5",
+        "ELEMTYPE_UNK6": "ELEM_MATERIAL_UNK6",
+        "ELEMTYPE_UNK7": "ELEM_MATERIAL_UNK7",
+        "OPEN_DISPS(play->state.gfxCtx)": "OPEN_DISPS(play->state.gfxCtx, __FILE__, __LINE__)",
+        "CLOSE_DISPS(play->state.gfxCtx)": "CLOSE_DISPS(play->state.gfxCtx, __FILE__, __LINE__)",
+    }
+    _correction_passes = _compile_correction_passes(mandatory_corrections)
+    _correction_probe = _LiteralScanner(tuple(mandatory_corrections) + ("(PlayState*",))
+
+    # Wrong parameter order in actor lifecycle functions, fixed in one pass
+    _parameter_order_fix = re.compile(
+        r"void\s+(\w+)_(Init|Update|Destroy|Draw)\(PlayState\*\s+(\w+),\s*Actor\*\s+(\w+)\)"
+    )
+
+    # Forbidden patterns that indicate non-authenticity (STRICT)
+    forbidden_patterns = (
+        r"GlobalContext\*\s+\w+",  # Any GlobalContext usage
+        r"void\s+\w+_Init\(PlayState\*.*?Actor\*",  # Wrong parameter order
+        r"void\s+\w+_Update\(PlayState\*.*?Actor\*",  # Wrong parameter order
+        r"ACTOR_HEART_PIECE",  # Custom heart piece actors (should use EN_ITEM00)
+        r"HeartPieceActor",  # Custom heart piece structs
+        r"\.pos\.",  # Direct pos access instead of world.pos
+        r"gPlayState",  # Global state variables
+        r"gGlobalCtx",  # Global context variables
+        
+        # NEW: Feedback-based forbidden patterns
+        r"play->state\.input\[0\]\.press\.button",  # Incorrect input handling pattern
+        r"Actor_DrawScale",  # Non-existent drawing function
+        r"Actor_DrawModel",  # Non-existent drawing function
+        r"Actor_DrawMesh",  # Non-existent drawing function
+        r"Actor_RenderModel",  # Non-existent drawing function
+        r"play->msgCtx\.choiceIndex",  # Incorrect message system usage
+        r"Message_GetState.*TEXT_STATE_CHOICE",  # Incorrect message state checking
+        r"LightContext_InsertLight",  # Incorrect lighting implementation
+        r"player->actor\.world\.pos\.[xyz]\s*=",  # Direct player position manipulation (CRITICAL)
+        
+        # NEW: Additional feedback-based forbidden patterns
+        r"SkelAnime_BlendFrames",  # Non-existent animation blending function
+        r"ANIM_BLEND_MAX_JOINTS",  # Non-existent animation constant
+        r"PLAYER_MASK_13",  # Non-existent player mask constant
+        r"Player_Action_80846978",  # Non-existent player action function
+        r"ENTR_TEMPLE_OF_TIME_0",  # Non-existent entrance constant
+        r"TRANS_TYPE_FADE_WHITE",  # Non-existent transition type
+        r"TRANS_TRIGGER_START",  # Non-existent transition trigger
+        
+        # NEW: Additional feedback-based forbidden patterns
+        r"Lights_PointGlowSetInfo",  # Non-existent lighting function signature
+        r"Lights_PointNoGlowSetInfo",  # Non-existent lighting function signature
+        r"Math_Vec3f_DistXZ",  # Non-existent math function
+        r"BGCHECKFLAG_GROUND",  # Non-existent collision flag
+        r"\"\"\"[^\"]+\"\"\"",  # Triple-quoted strings in C code
+        
+        # NEW: Updated forbidden patterns based on compilation testing
+        r"COLTYPE_[A-Z_]+",  # Wrong collision type constants (use COL_MATERIAL_*)
+        r"ELEMTYPE_[A-Z_]+",  # Wrong element type constants (use ELEM_MATERIAL_*)
+        r"OPEN_DISPS\(play->state\.gfxCtx\)(?!\s*,\s*__FILE__)",  # Missing file/line parameters
+        r"CLOSE_DISPS\(play->state\.gfxCtx\)(?!\s*,\s*__FILE__)",  # Missing file/line parameters
+        r"func_8002F71C",  # Non-existent function
+        r"sCylinderInit(?!\s*=)",  # Using sCylinderInit without declaring it
+        r"SkelAnime_InitFlex\([^,]*,[^,]*,[^,]*,[^,]*,[^,]*,[^,]*,\s*0\)",  # Wrong parameters
+        r"player->actor\.id\s*!=\s*ACTOR_PLAYER",  # Wrong player ID check
+        r"gSaveContext\.inventory\.questItems\s*&\s*0x3F",  # Wrong quest item check
+        r"play->colCtx\.waterLevel\s*=",  # Direct water level manipulation
+        r"play->msgCtx\.ocarinaMode\s*==\s*OCARINA_MODE_04",  # Wrong ocarina mode check
+        r"player->health",  # Wrong player health access
+        r"player->healthCapacity",  # Wrong player health capacity access
+        r"player->currentShield",  # Non-existent player shield access
+        r"player->swordState",  # Non-existent player sword state access
+        r"PLAYER_SHIELD_MAX",  # Non-existent constant
+        r"PLAYER_SWORD_MAX",  # Non-existent constant
+        r"LIMB_COUNT",  # Non-existent constant
+        r"ACTOR_FLAG_[8-9]|ACTOR_FLAG_1[0-9]",  # Non-existent actor flags
+        r"INV_CONTENT",  # Non-existent inventory function
+        r"Actor_DrawOpa",  # Non-existent drawing function
+        r"SkelAnime_DrawOpa\([^,]*,[^,]*,[^,]*,[^,]*,[^,]*,[^,]*\)",  # Wrong signature
+        r"ZeldaArena_MallocDebug",  # Non-existent debug function
+        r"ZeldaArena_FreeDebug",  # Non-existent debug function
+    )
+    
+    # Critical feedback patterns carrying an extra score penalty
+    critical_patterns = (
+        r"player->actor\.world\.pos\.[xyz]\s*=",  # Direct player position manipulation
+        r"play->state\.input\[0\]\.press\.button",  # Incorrect input handling
+        r"Actor_DrawScale|Actor_DrawModel|Actor_DrawMesh|Actor_RenderModel",  # Non-existent drawing functions
+        r"play->msgCtx\.choiceIndex",  # Incorrect message system
+        r"LightContext_InsertLight",  # Incorrect lighting
+        r"SkelAnime_BlendFrames",  # Non-existent animation blending function
+        r"ANIM_BLEND_MAX_JOINTS",  # Non-existent animation constant
+        r"PLAYER_MASK_13",  # Non-existent player mask constant
+        r"Player_Action_80846978",  # Non-existent player action function
+        r"ENTR_TEMPLE_OF_TIME_0",  # Non-existent entrance constant
+        r"TRANS_TYPE_FADE_WHITE",  # Non-existent transition type
+    )
+    
+    _forbidden_checks = [(p, _literal_alternatives(p), _pattern_matcher(p)) for p in forbidden_patterns]
+    _forbidden_messages = {p: f"FORBIDDEN: Found non-authentic pattern: {p}" for p in forbidden_patterns}
+    _forbidden_literals = _LiteralScanner(alt for p in forbidden_patterns for alt in _literal_alternatives(p) or ())
+    _critical_checks = _critical_checks_over(critical_patterns, forbidden_patterns)
+    
+    # Required authentic patterns for quality code
+    required_patterns = (
+        r"PlayState\*\s+play",  # Modern PlayState usage
+        r"Actor\*\s+thisx",  # Authentic actor parameter
+        r"world\.pos",  # Proper position access
+        r"ACTORCAT_\w+",  # Actor categories
+        r"Collider_\w+",  # Collision functions
+        r"COL_MATERIAL_\w+",  # Correct collision material constants
+        r"ELEM_MATERIAL_\w+",  # Correct element material constants
+        r"OPEN_DISPS\(play->state\.gfxCtx,\s*__FILE__,\s*__LINE__\)",  # Correct OPEN_DISPS usage
+        r"CLOSE_DISPS\(play->state\.gfxCtx,\s*__FILE__,\s*__LINE__\)",  # Correct CLOSE_DISPS usage
+        r"static\s+ColliderCylinderInit\s+sCylinderInit",  # Proper collision initialization
+        r"UPDBGCHECKINFO_FLAG_\d+",  # Correct background check flags
+    )
+    _required_checks = [_pattern_matcher(p) for p in required_patterns]
+    _required_threshold = math.ceil(len(required_patterns) * 0.8)
+    _required_misses_allowed = len(required_patterns) - _required_threshold
+    
+    # Compiler error fragments and the suggestion each one triggers
+    _COMPILE_HINTS = (
+        ("unknown type name", "Include proper OoT header files (z_actor.h, z_play.h, etc.)"),
+        ("implicit declaration", "Add proper function declarations or include required headers"),
+        ("undefined reference", "Ensure all referenced functions are properly declared"),
+    )
+    
+    # Real architectural patterns from OoT decompilation
+    architectural_guidance = {
+        "heart_piece": "Use EnItem00 with ITEM00_HEART_PIECE parameter (from z_en_item00.c)",
+        "rupees": "Use EnItem00 with ITEM00_RUPEE_* parameters (from z_en_item00.c)", 
+        "keys": "Use EnItem00 with ITEM00_SMALL_KEY parameter (from z_en_item00.c)",
+        "collectibles": "Most collectibles use EnItem00 with different parameters (see z_en_item00.c)",
+        "switches": "Use existing switch actors with parameters, rarely create new ones",
+        "ocarina": "Ocarina handling is done through player actor's state machine, not separate actors. Use Player_UpdateOcarina() and built-in song recognition",
+        "animation_blending": "Use Animation_MorphToLoop() or Animation_Change() with morph parameters, not dedicated blending functions",
+        "transitions": "Use authentic entrance constants and transition types from OoT decompilation",
+        "lighting": "Use LightContext_InsertLight() with proper LightInfo structure, not Lights_PointGlowSetInfo()",
+        "matrix_strings": "Use __FILE__, __LINE__ for Matrix_NewMtx(), not triple-quoted strings",
+        "background_collision": "Use UPDBGCHECKINFO_FLAG_0 | UPDBGCHECKINFO_FLAG_2 for Actor_UpdateBgCheckInfo()",
+        "math_functions": "Use sqrtf(SQ(dx) + SQ(dz)) for distance calculations, not Math_Vec3f_DistXZ()",
+        "collision_materials": "Use COL_MATERIAL_* constants (COL_MATERIAL_NONE, COL_MATERIAL_HIT0, etc.) instead of COLTYPE_*",
+        "element_materials": "Use ELEM_MATERIAL_* constants (ELEM_MATERIAL_UNK0, ELEM_MATERIAL_UNK1, etc.) instead of ELEMTYPE_*",
+        "graphics_macros": "Use OPEN_DISPS(play->state.gfxCtx, __FILE__, __LINE__) and CLOSE_DISPS(play->state.gfxCtx, __FILE__, __LINE__)",
+        "collision_init": "Declare static ColliderCylinderInit sCylinderInit = { ... }; for collision initialization",
+        "skeleton_init": "Use SkelAnime_InitFlex(play, &skelAnime, skeleton, animation, jointTable, morphTable, limbCount)",
+        "player_access": "Use gSaveContext.health and gSaveContext.healthCapacity for player health, gSaveContext.equips.buttonItems for equipment",
+        "actor_flags": "Use ACTOR_FLAG_0 through ACTOR_FLAG_15 for actor flags",
+        "memory_management": "Use ZeldaArena_Malloc(size) and ZeldaArena_Free(ptr) for memory management",
+        "drawing_functions": "Use SkelAnime_DrawFlexOpa(play, skeleton, jointTable, dListCount, NULL, NULL, this) for skeleton drawing",
+    }
+    
     def __init__(self, source_analyzer: Optional[DynamicSourceAnalyzer] = None):
         # Use dynamic source analyzer if provided, otherwise use OoTAuthenticPatterns data
         self.source_analyzer = source_analyzer
         
         if source_analyzer:
             # Real function signatures from actual OoT decompilation
-            self.authentic_function_signatures = set(source_analyzer.real_functions.keys())
+            self.authentic_function_signatures = frozenset(source_analyzer.real_functions.keys())
             
             # Real OoT types from decompilation
-            self.authentic_types = set(source_analyzer.real_structs.keys())
+            self.authentic_types = frozenset(source_analyzer.real_structs.keys())
         else:
             # Use OoTAuthenticPatterns data instead of hardcoded lists
             from helpers.validate_and_enhance_scenarios import OoTAuthenticPatterns
             patterns = OoTAuthenticPatterns()
-            self.authentic_function_signatures = patterns.AUTHENTIC_FUNCTIONS
-            self.authentic_types = patterns.AUTHENTIC_CONSTANTS  # Use constants as types too
-        
-        # Mandatory corrections for authenticity
-        self.mandatory_corrections = {
-            # Function signature corrections
-            "GlobalContext": "PlayState",
-            "globalCtx": "play",
-            "void ActorName_Init(PlayState* play, Actor* thisx)": "void ActorName_Init(Actor* thisx, PlayState* play)",
-            "void ActorName_Update(PlayState* play, Actor* thisx)": "void ActorName_Update(Actor* thisx, PlayState* play)",
-            "void ActorName_Destroy(PlayState* play, Actor* thisx)": "void ActorName_Destroy(Actor* thisx, PlayState* play)",
-            "void ActorName_Draw(PlayState* play, Actor* thisx)": "void ActorName_Draw(Actor* thisx, PlayState* play)",
-            
-            # Position access corrections (from real decompilation)
-            "this->actor.pos": "this->actor.world.pos",
-            "this->actor.rot": "this->actor.world.rot", 
-            "player->actor.pos": "player->actor.world.pos",
-            
-            # Structure corrections
-            "ActorInit": "ActorProfile",
-            "const ActorInit": "const ActorProfile",
-            
-            # NEW: Feedback-based corrections
-            "play->state.input[0].press.button": "input->press.button",  # Will be used with Input* input = &play->state.input[0]
-            "Actor_DrawScale": "SkelAnime_DrawOpa",  # Replace non-existent drawing functions
-            "Actor_DrawModel": "SkelAnime_DrawOpa",
-            "Actor_DrawMesh": "Gfx_DrawDListOpa",
-            "Actor_RenderModel": "Gfx_DrawDListOpa",
-            "LightContext_InsertLight": "Lights_PointGlowSetInfo",  # Correct lighting function
-            
-            # NEW: Additional feedback-based corrections
-            "SkelAnime_BlendFrames": "Animation_MorphToLoop",  # Replace non-existent animation blending
-            "ANIM_BLEND_MAX_JOINTS": "PLAYER_LIMB_MAX",  # Replace with authentic constant
-            "PLAYER_MASK_13": "PLAYER_MASK_OCARINA",  # Replace with authentic mask
-            "Player_Action_80846978": "Player_UpdateOcarina",  # Replace with authentic function
-            "ENTR_TEMPLE_OF_TIME_0": "ENTR_TEMPLE_OF_TIME",  # Replace with authentic entrance
-            "TRANS_TYPE_FADE_WHITE": "TRANS_TYPE_FADE_BLACK",  # Replace with authentic transition
-            "TRANS_TRIGGER_START": "TRANS_TRIGGER_START",  # Keep but verify usage
-            
-            # NEW: Additional feedback-based corrections
-            "Lights_PointGlowSetInfo": "LightContext_InsertLight",  # Replace with authentic lighting function
-            "Lights_PointNoGlowSetInfo": "LightContext_InsertLight",  # Replace with authentic lighting function
-            "Math_Vec3f_DistXZ": "sqrtf(SQ(dx) + SQ(dz))",  # Replace with manual calculation
-            "BGCHECKFLAG_GROUND": "UPDBGCHECKINFO_FLAG_0 | UPDBGCHECKINFO_FLAG_2",  # Replace with authentic flags
-            
-            # NEW: Updated corrections based on compilation testing
-            "COLTYPE_NONE": "COL_MATERIAL_NONE",
-            "COLTYPE_HIT0": "COL_MATERIAL_HIT0", 
-            "COLTYPE_HIT1": "COL_MATERIAL_HIT1",
-            "COLTYPE_HIT2": "COL_MATERIAL_HIT2",
-            "COLTYPE_HIT3": "COL_MATERIAL_HIT3",
-            "COLTYPE_METAL": "COL_MATERIAL_METAL",
-            "COLTYPE_WOOD": "COL_MATERIAL_WOOD",
-            "COLTYPE_HARD": "COL_MATERIAL_HARD",
-            "COLTYPE_TREE": "COL_MATERIAL_TREE",
-            "ELEMTYPE_UNK0": "ELEM_MATERIAL_UNK0",
-            "ELEMTYPE_UNK1": "ELEM_MATERIAL_UNK1",
-            "ELEMTYPE_UNK2": "ELEM_MATERIAL_UNK2",
-            "ELEMTYPE_UNK3": "ELEM_MATERIAL_UNK3",
-            "ELEMTYPE_UNK4": "ELEM_MATERIAL_UNK4",
-            "ELEMTYPE_UNK5": "ELEM_MATERIAL_UNK5",
-            "ELEMTYPE_UNK6": "ELEM_MATERIAL_UNK6",
-            "ELEMTYPE_UNK7": "ELEM_MATERIAL_UNK7",
-            "OPEN_DISPS(play->state.gfxCtx)": "OPEN_DISPS(play->state.gfxCtx, __FILE__, __LINE__)",
-            "CLOSE_DISPS(play->state.gfxCtx)": "CLOSE_DISPS(play->state.gfxCtx, __FILE__, __LINE__)",
-        }
-        
-        # Forbidden patterns that indicate non-authenticity (STRICT)
-        self.forbidden_patterns = [
-            r"GlobalContext\*\s+\w+",  # Any GlobalContext usage
-            r"void\s+\w+_Init\(PlayState\*.*?Actor\*",  # Wrong parameter order
-            r"void\s+\w+_Update\(PlayState\*.*?Actor\*",  # Wrong parameter order
-            r"ACTOR_HEART_PIECE",  # Custom heart piece actors (should use EN_ITEM00)
-            r"HeartPieceActor",  # Custom heart piece structs
-            r"\.pos\.",  # Direct pos access instead of world.pos
-            r"gPlayState",  # Global state variables
-            r"gGlobalCtx",  # Global context variables
-            
-            # NEW: Feedback-based forbidden patterns
-            r"play->state\.input\[0\]\.press\.button",  # Incorrect input handling pattern
-            r"Actor_DrawScale",  # Non-existent drawing function
-            r"Actor_DrawModel",  # Non-existent drawing function
-            r"Actor_DrawMesh",  # Non-existent drawing function
-            r"Actor_RenderModel",  # Non-existent drawing function
-            r"play->msgCtx\.choiceIndex",  # Incorrect message system usage
-            r"Message_GetState.*TEXT_STATE_CHOICE",  # Incorrect message state checking
-            r"LightContext_InsertLight",  # Incorrect lighting implementation
-            r"player->actor\.world\.pos\.[xyz]\s*=",  # Direct player position manipulation (CRITICAL)
-            
-            # NEW: Additional feedback-based forbidden patterns
-            r"SkelAnime_BlendFrames",  # Non-existent animation blending function
-            r"ANIM_BLEND_MAX_JOINTS",  # Non-existent animation constant
-            r"PLAYER_MASK_13",  # Non-existent player mask constant
-            r"Player_Action_80846978",  # Non-existent player action function
-            r"ENTR_TEMPLE_OF_TIME_0",  # Non-existent entrance constant
-            r"TRANS_TYPE_FADE_WHITE",  # Non-existent transition type
-            r"TRANS_TRIGGER_START",  # Non-existent transition trigger
-            
-            # NEW: Additional feedback-based forbidden patterns
-            r"Lights_PointGlowSetInfo",  # Non-existent lighting function signature
-            r"Lights_PointNoGlowSetInfo",  # Non-existent lighting function signature
-            r"Math_Vec3f_DistXZ",  # Non-existent math function
-            r"BGCHECKFLAG_GROUND",  # Non-existent collision flag
-            r"\"\"\"[^\"]+\"\"\"",  # Triple-quoted strings in C code
-            
-            # NEW: Updated forbidden patterns based on compilation testing
-            r"COLTYPE_[A-Z_]+",  # Wrong collision type constants (use COL_MATERIAL_*)
-            r"ELEMTYPE_[A-Z_]+",  # Wrong element type constants (use ELEM_MATERIAL_*)
-            r"OPEN_DISPS\(play->state\.gfxCtx\)(?!\s*,\s*__FILE__)",  # Missing file/line parameters
-            r"CLOSE_DISPS\(play->state\.gfxCtx\)(?!\s*,\s*__FILE__)",  # Missing file/line parameters
-            r"func_8002F71C",  # Non-existent function
-            r"sCylinderInit(?!\s*=)",  # Using sCylinderInit without declaring it
-            r"SkelAnime_InitFlex\([^,]*,[^,]*,[^,]*,[^,]*,[^,]*,[^,]*,\s*0\)",  # Wrong parameters
-            r"player->actor\.id\s*!=\s*ACTOR_PLAYER",  # Wrong player ID check
-            r"gSaveContext\.inventory\.questItems\s*&\s*0x3F",  # Wrong quest item check
-            r"play->colCtx\.waterLevel\s*=",  # Direct water level manipulation
-            r"play->msgCtx\.ocarinaMode\s*==\s*OCARINA_MODE_04",  # Wrong ocarina mode check
-            r"player->health",  # Wrong player health access
-            r"player->healthCapacity",  # Wrong player health capacity access
-            r"player->currentShield",  # Non-existent player shield access
-            r"player->swordState",  # Non-existent player sword state access
-            r"PLAYER_SHIELD_MAX",  # Non-existent constant
-            r"PLAYER_SWORD_MAX",  # Non-existent constant
-            r"LIMB_COUNT",  # Non-existent constant
-            r"ACTOR_FLAG_[8-9]|ACTOR_FLAG_1[0-9]",  # Non-existent actor flags
-            r"INV_CONTENT",  # Non-existent inventory function
-            r"Actor_DrawOpa",  # Non-existent drawing function
-            r"SkelAnime_DrawOpa\([^,]*,[^,]*,[^,]*,[^,]*,[^,]*,[^,]*\)",  # Wrong signature
-            r"ZeldaArena_MallocDebug",  # Non-existent debug function
-            r"ZeldaArena_FreeDebug",  # Non-existent debug function
-        ]
-        
-        # Required authentic patterns for quality code
-        self.required_patterns = [
-            r"PlayState\*\s+play",  # Modern PlayState usage
-            r"Actor\*\s+thisx",  # Authentic actor parameter
-            r"world\.pos",  # Proper position access
-            r"ACTORCAT_\w+",  # Actor categories
-            r"Collider_\w+",  # Collision functions
-            r"COL_MATERIAL_\w+",  # Correct collision material constants
-            r"ELEM_MATERIAL_\w+",  # Correct element material constants
-            r"OPEN_DISPS\(play->state\.gfxCtx,\s*__FILE__,\s*__LINE__\)",  # Correct OPEN_DISPS usage
-            r"CLOSE_DISPS\(play->state\.gfxCtx,\s*__FILE__,\s*__LINE__\)",  # Correct CLOSE_DISPS usage
-            r"static\s+ColliderCylinderInit\s+sCylinderInit",  # Proper collision initialization
-            r"UPDBGCHECKINFO_FLAG_\d+",  # Correct background check flags
-        ]
+            self.authentic_function_signatures = frozenset(patterns.AUTHENTIC_FUNCTIONS)
+            self.authentic_types = frozenset(patterns.AUTHENTIC_CONSTANTS)  # Use constants as types too
         
-        # Real architectural patterns from OoT decompilation
-        self.architectural_guidance = {
-            "heart_piece": "Use EnItem00 with ITEM00_HEART_PIECE parameter (from z_en_item00.c)",
-            "rupees": "Use EnItem00 with ITEM00_RUPEE_* parameters (from z_en_item00.c)", 
-            "keys": "Use EnItem00 with ITEM00_SMALL_KEY parameter (from z_en_item00.c)",
-            "collectibles": "Most collectibles use EnItem00 with different parameters (see z_en_item00.c)",
-            "switches": "Use existing switch actors with parameters, rarely create new ones",
-            "ocarina": "Ocarina handling is done through player actor's state machine, not separate actors. Use Player_UpdateOcarina() and built-in song recognition",
-            "animation_blending": "Use Animation_MorphToLoop() or Animation_Change() with morph parameters, not dedicated blending functions",
-            "transitions": "Use authentic entrance constants and transition types from OoT decompilation",
-            "lighting": "Use LightContext_InsertLight() with proper LightInfo structure, not Lights_PointGlowSetInfo()",
-            "matrix_strings": "Use __FILE__, __LINE__ for Matrix_NewMtx(), not triple-quoted strings",
-            "background_collision": "Use UPDBGCHECKINFO_FLAG_0 | UPDBGCHECKINFO_FLAG_2 for Actor_UpdateBgCheckInfo()",
-            "math_functions": "Use sqrtf(SQ(dx) + SQ(dz)) for distance calculations, not Math_Vec3f_DistXZ()",
-            "collision_materials": "Use COL_MATERIAL_* constants (COL_MATERIAL_NONE, COL_MATERIAL_HIT0, etc.) instead of COLTYPE_*",
-            "element_materials": "Use ELEM_MATERIAL_* constants (ELEM_MATERIAL_UNK0, ELEM_MATERIAL_UNK1, etc.) instead of ELEMTYPE_*",
-            "graphics_macros": "Use OPEN_DISPS(play->state.gfxCtx, __FILE__, __LINE__) and CLOSE_DISPS(play->state.gfxCtx, __FILE__, __LINE__)",
-            "collision_init": "Declare static ColliderCylinderInit sCylinderInit = { ... }; for collision initialization",
-            "skeleton_init": "Use SkelAnime_InitFlex(play, &skelAnime, skeleton, animation, jointTable, morphTable, limbCount)",
-            "player_access": "Use gSaveContext.health and gSaveContext.healthCapacity for player health, gSaveContext.equips.buttonItems for equipment",
-            "actor_flags": "Use ACTOR_FLAG_0 through ACTOR_FLAG_15 for actor flags",
-            "memory_management": "Use ZeldaArena_Malloc(size) and ZeldaArena_Free(ptr) for memory management",
-            "drawing_functions": "Use SkelAnime_DrawFlexOpa(play, skeleton, jointTable, dListCount, NULL, NULL, this) for skeleton drawing",
-        }
-
-        self.function_validator = FunctionSignatureValidator()
         self.code_extractor = CCodeExtractor()
         self.compiler = None  # Will be initialized when needed
 
+        # Recent analyses keyed by code; the same output is often revalidated
+        self._analysis_cache = {}
+        self._corrections_cache = {}
+        self._score_cache = {}
+        self._validation_cache = {}
+
+    @cached_property
+    def function_validator(self) -> FunctionSignatureValidator:
+        """Signature validator, loaded from the detailed functions file on first use"""
+        return FunctionSignatureValidator()
+
+    def _analyze(self, code: str) -> _CodeAnalysis:
+        """Scan code once for everything the validation methods report on"""
+        analysis = self._analysis_cache.get(code)
+        if analysis is not None:
+            return analysis
+
+        # One call scan serves the score, the fallback and the source analyzer
+        call_names = _scan_call_names(code)
+        # Look each distinct name up once, then keep the calls in order with repeats
+        unknown_names = set(call_names).difference(self.authentic_function_signatures)
+        found_literals = self._forbidden_literals.present(code)
+        forbidden_hits = [pattern for pattern, literals, matches in self._forbidden_checks
+                          if (not found_literals.isdisjoint(literals) if literals is not None else matches(code))]
+        analysis = _CodeAnalysis(
+            wrong_order_hits=(sum(1 for pattern in _WRONG_ORDER_PATTERNS if pattern.search(code))
+                              if "(PlayState*" in code and _WRONG_ORDER_ANY_PATTERN.search(code) else 0),
+            uses_global_context="GlobalContext" in code,
+            forbidden_hits=forbidden_hits,
+            critical_hits=self._count_critical_hits(code, forbidden_hits),
+            call_names=call_names,
+            unknown_calls=[name for name in call_names if name in unknown_names],
+            source_issues=(self.source_analyzer.validate_against_real_source(code, call_names)
+                           if self.source_analyzer else []),
+            feedback_issues=self._feedback_issues(code),
+        )
+        return _remember(self._analysis_cache, code, analysis)
+
+    def _count_critical_hits(self, code: str, forbidden_hits: List[str]) -> int:
+        """Count critical patterns present, reading them off the forbidden hits where possible"""
+        forbidden_found = set(forbidden_hits)
+        return sum(1 for sources, matches in self._critical_checks
+                   if (not forbidden_found.isdisjoint(sources) if sources else matches(code)))
+
     def validate_function_signatures(self, code: str) -> List[str]:
         """Strict validation against real OoT function signatures"""
-        issues = []
+        if not code:
+            return []
+        analysis = self._analyze(code)
         
         # Check for wrong parameter order in actor lifecycle functions
-        wrong_order_patterns = [
-            r"void\s+\w+_Init\(PlayState\*[^,]*,\s*Actor\*",
-            r"void\s+\w+_Update\(PlayState\*[^,]*,\s*Actor\*", 
-            r"void\s+\w+_Destroy\(PlayState\*[^,]*,\s*Actor\*",
-            r"void\s+\w+_Draw\(PlayState\*[^,]*,\s*Actor\*",
-        ]
-        
-        for pattern in wrong_order_patterns:
-            if re.search(pattern, code):
-                issues.append("CRITICAL: Wrong parameter order - should be (Actor* thisx, PlayState* play)")
+        issues = ["CRITICAL: Wrong parameter order - should be (Actor* thisx, PlayState* play)"] * analysis.wrong_order_hits
         
         # Check for GlobalContext usage
-        if re.search(r"GlobalContext", code):
+        if analysis.uses_global_context:
             issues.append("CRITICAL: Uses outdated GlobalContext instead of PlayState")
             
         # Check for forbidden architectural patterns
-        for pattern in self.forbidden_patterns:
-            if re.search(pattern, code):
-                issues.append(f"FORBIDDEN: Found non-authentic pattern: {pattern}")
+        issues.extend(self._forbidden_messages[pattern] for pattern in analysis.forbidden_hits)
         
         # Use dynamic source analyzer if available
         if self.source_analyzer:
-            dynamic_issues = self.source_analyzer.validate_against_real_source(code)
-            issues.extend(dynamic_issues)
+            issues.extend(analysis.source_issues)
         else:
             # Fallback to hardcoded validation
-            func_pattern = r'(\w+)\s*\('
-            unknown_functions = []
-            for match in re.finditer(func_pattern, code):
-                func_name = match.group(1)
-                if (func_name not in self.authentic_function_signatures and 
-                    func_name not in ['if', 'for', 'while', 'switch', 'sizeof', 'typedef'] and
-                    not func_name.startswith('g') and  # Skip display lists
-                    not func_name.isupper() and  # Skip macros
-                    len(func_name) > 3):  # Skip short names
-                    unknown_functions.append(func_name)
+            unknown_functions = analysis.unknown_calls
                     
             if unknown_functions:
                 issues.append(f"NON-AUTHENTIC: Unknown functions: {', '.join(unknown_functions[:5])}")
         
         return issues
 
+    def validate_batch(self, codes: List[str]) -> List[List[str]]:
+        """Signature issues for many generated outputs, analyzing each distinct output once"""
+        issues_by_code = {}
+        for code in codes:
+            if code not in issues_by_code:
+                issues_by_code[code] = self.validate_function_signatures(code)
+        return [list(issues_by_code[code]) for code in codes]
+
     def validate_architectural_authenticity(self, code: str, instruction: str) -> List[str]:
         """Validate against authentic OoT architectural patterns"""
         issues = []
+        instruction_lower = instruction.lower()
         
         # Check for custom heart piece actors (should use EnItem00)
-        if "heart piece" in instruction.lower() and "ACTOR_HEART_PIECE" in code:
+        if "heart piece" in instruction_lower and "ACTOR_HEART_PIECE" in code:
             issues.append("ARCHITECTURAL: Heart pieces should use EnItem00 with ITEM00_HEART_PIECE parameter")
             
         # Check for custom collectible actors
         collectible_keywords = ["rupee", "key", "magic jar", "arrow bundle"]
-        if any(keyword in instruction.lower() for keyword in collectible_keywords):
+        if any(keyword in instruction_lower for keyword in collectible_keywords):
             if "EnItem00" not in code and "ACTOR_EN_ITEM00" not in code:
                 issues.append("ARCHITECTURAL: Collectibles should typically use EnItem00 (see z_en_item00.c)")
         
@@ -287,179 +707,158 @@ class StrictAuthenticityValidator:
 
     def apply_mandatory_corrections(self, code: str) -> str:
         """Apply mandatory corrections for authenticity"""
+        # Clean code is the common case; skip the substitution passes entirely
+        if not self._correction_probe.contains_any(code):
+            return code
+        if code in self._corrections_cache:
+            return self._corrections_cache[code]
+
         corrected = code
-        
-        for old_pattern, new_pattern in self.mandatory_corrections.items():
-            corrected = corrected.replace(old_pattern, new_pattern)
-        
-        # Fix parameter order with regex
-        parameter_fixes = [
-            (r"void\s+(\w+)_Init\(PlayState\*\s+(\w+),\s*Actor\*\s+(\w+)\)",
-             r"void \1_Init(Actor* \3, PlayState* \2)"),
-            (r"void\s+(\w+)_Update\(PlayState\*\s+(\w+),\s*Actor\*\s+(\w+)\)",
-             r"void \1_Update(Actor* \3, PlayState* \2)"),
-            (r"void\s+(\w+)_Destroy\(PlayState\*\s+(\w+),\s*Actor\*\s+(\w+)\)",
-             r"void \1_Destroy(Actor* \3, PlayState* \2)"),
-            (r"void\s+(\w+)_Draw\(PlayState\*\s+(\w+),\s*Actor\*\s+(\w+)\)",
-             r"void \1_Draw(Actor* \3, PlayState* \2)"),
-        ]
-        
-        for old_regex, new_format in parameter_fixes:
-            corrected = re.sub(old_regex, new_format, corrected)
-            
-        return corrected
+
+        for pattern, replace_match in self._correction_passes:
+            corrected = pattern.sub(replace_match, corrected)
+
+        # Fix parameter order with regex, only where a PlayState-first signature can exist
+        if "(PlayState*" in corrected:
+            corrected = self._parameter_order_fix.sub(r"void \1_\2(Actor* \4, PlayState* \3)", corrected)
+
+        return _remember(self._corrections_cache, code, corrected)
 
     def calculate_authenticity_score(self, code: str) -> float:
         """Calculate authenticity score based on real OoT patterns"""
-        score = 10.0  # Start with perfect score
-        
-        # Major penalties for forbidden patterns
-        for pattern in self.forbidden_patterns:
-            if re.search(pattern, code):
-                score -= 2.0
-                
-        # NEW: Extra penalties for critical feedback patterns
-        critical_patterns = [
-            r"player->actor\.world\.pos\.[xyz]\s*=",  # Direct player position manipulation
-            r"play->state\.input\[0\]\.press\.button",  # Incorrect input handling
-            r"Actor_DrawScale|Actor_DrawModel|Actor_DrawMesh|Actor_RenderModel",  # Non-existent drawing functions
-            r"play->msgCtx\.choiceIndex",  # Incorrect message system
-            r"LightContext_InsertLight",  # Incorrect lighting
-            r"SkelAnime_BlendFrames",  # Non-existent animation blending function
-            r"ANIM_BLEND_MAX_JOINTS",  # Non-existent animation constant
-            r"PLAYER_MASK_13",  # Non-existent player mask constant
-            r"Player_Action_80846978",  # Non-existent player action function
-            r"ENTR_TEMPLE_OF_TIME_0",  # Non-existent entrance constant
-            r"TRANS_TYPE_FADE_WHITE",  # Non-existent transition type
-        ]
-        
-        for pattern in critical_patterns:
-            if re.search(pattern, code):
-                score -= 3.0  # Extra penalty for critical issues
+        if not code:
+            return 10.0
+        if code not in self._score_cache:
+            _remember(self._score_cache, code, self._score(code))
+        return self._score_cache[code]
+
+    def _score(self, code: str) -> float:
+        analysis = self._analyze(code)
+        # Start with perfect score, less major penalties for forbidden patterns
+        # and extra penalties for critical feedback patterns (both hit counts)
+        score = 10.0 - 2.0 * len(analysis.forbidden_hits) - 3.0 * analysis.critical_hits
+        
+        # The function blend keeps at most 110% of a negative score and the
+        # required bonus adds 1.0, so from -10 down the result is always 0.0
+        if score <= -10.0:
+            return 0.0
                 
         # Check function authenticity
-        func_pattern = r'(\w+)\s*\('
-        total_functions = 0
-        authentic_functions = 0
-        
-        for match in re.finditer(func_pattern, code):
-            func_name = match.group(1)
-            if (func_name not in ['if', 'for', 'while', 'switch', 'sizeof', 'typedef'] and
-                not func_name.startswith('g') and not func_name.isupper() and len(func_name) > 3):
-                total_functions += 1
-                if func_name in self.authentic_function_signatures:
-                    authentic_functions += 1
+        total_functions = len(analysis.call_names)
+        authentic_functions = total_functions - len(analysis.unknown_calls)
                     
-        if total_functions > 0:
+        if total_functions > 0 and score != 0.0:
             func_authenticity = authentic_functions / total_functions
             score = score * func_authenticity + (score * 0.1)  # Blend score based on function authenticity
         
-        # Bonus for required patterns
-        required_found = sum(1 for pattern in self.required_patterns if re.search(pattern, code))
-        if required_found >= len(self.required_patterns) * 0.8:
-            score += 1.0
+        # The required bonus is at most 1.0, so it cannot move a score already
+        # clamped at either end
+        if score >= 10.0:
+            return 10.0
+        if score <= -1.0:
+            return 0.0
+        
+        # Bonus for required patterns, stop counting once it is earned or out of reach
+        required_found = required_missed = 0
+        for matches in self._required_checks:
+            if matches(code):
+                required_found += 1
+                if required_found >= self._required_threshold:
+                    score += 1.0
+                    break
+            else:
+                required_missed += 1
+                if required_missed > self._required_misses_allowed:
+                    break
             
         return max(0.0, min(10.0, score))
 
     def validate_feedback_patterns(self, code: str) -> List[str]:
         """Validate against feedback patterns from previous runs"""
+        if not code:
+            return []
+        return list(self._analyze(code).feedback_issues)
+
+    def _feedback_issues(self, code: str) -> List[str]:
         issues = []
+        # Case folding is exact for ASCII only, so only ASCII code gets the lowercased scan
+        code_lower = code.lower() if code.isascii() else None
         
         # Check for Majora's Mask contamination
-        mm_patterns = [
-            r'TRANSFORM_STATE_DEKU', r'TRANSFORM_STATE_GORON', r'TRANSFORM_STATE_ZORA',
-            r'transformState', r'transformTimer', r'transformation',
-            r'Deku\s+form', r'Goron\s+form', r'Zora\s+form'
-        ]
-        
-        for pattern in mm_patterns:
-            if re.search(pattern, code, re.IGNORECASE):
-                issues.append("Majora's Mask contamination detected")
-                break
+        if _MAJORAS_MASK_MATCHER(code, code_lower):
+            issues.append("Majora's Mask contamination detected")
         
         # Check for fabricated functions
-        fabricated_patterns = [
-            r'Gfx_DrawDListOpa\s*\(\s*play,\s*[^)]+\s*\)',
-            r'Actor_DrawOpa\s*\(\s*play,\s*[^)]+\s*\)',
-            r'func_80093D18\s*\(',
-            r'ZeldaArena_MallocDebug\s*\(',
-            r'ZeldaArena_FreeDebug\s*\('
-        ]
-        
-        for pattern in fabricated_patterns:
-            if re.search(pattern, code):
-                issues.append("Fabricated function detected")
-                break
+        if any(pattern.search(code) for pattern in _FABRICATED_FUNCTION_PATTERNS):
+            issues.append("Fabricated function detected")
         
         # Check for wrong player struct access
-        wrong_player_patterns = [
-            r'player->currentShield', r'player->swordState', r'player->health',
-            r'player->equippedShield', r'player->equippedSword'
+        wrong_player_fields = [
+            'player->currentShield', 'player->swordState', 'player->health',
+            'player->equippedShield', 'player->equippedSword'
         ]
         
-        for pattern in wrong_player_patterns:
-            if re.search(pattern, code):
-                issues.append("Wrong player struct access - use gSaveContext instead")
-                break
+        if any(field in code for field in wrong_player_fields):
+            issues.append("Wrong player struct access - use gSaveContext instead")
         
         # Check for non-existent constants
         non_existent_constants = [
-            r'PLAYER_SHIELD_MAX', r'PLAYER_SWORD_MAX', r'LIMB_COUNT',
-            r'ACTOR_PLAYER', r'PLAYER_WEAPON_MAX'
+            'PLAYER_SHIELD_MAX', 'PLAYER_SWORD_MAX', 'LIMB_COUNT',
+            'ACTOR_PLAYER', 'PLAYER_WEAPON_MAX'
         ]
         
-        for pattern in non_existent_constants:
-            if re.search(pattern, code):
-                issues.append("Non-existent constant detected")
-                break
+        if any(constant in code for constant in non_existent_constants):
+            issues.append("Non-existent constant detected")
         
         # Check for wrong Matrix_NewMtx usage
-        if re.search(r'Matrix_NewMtx\s*\(\s*[^,]+,\s*"[^"]+"\s*\)', code):
+        if _MATRIX_NEWMTX_STRING_PATTERN.search(code):
             issues.append("Wrong Matrix_NewMtx parameters - use __FILE__, __LINE__")
         
         # Check for wrong OPEN_DISPS usage
-        if re.search(r'OPEN_DISPS\s*\(\s*[^,]+,\s*"[^"]+",\s*[^)]+\)', code):
+        if _OPEN_DISPS_FILE_LINE_PATTERN.search(code):
             issues.append("Wrong OPEN_DISPS usage - don't use file/line parameters")
         
         # Check for missing struct members
-        if re.search(r'this->jointTable|this->morphTable', code):
-            struct_pattern = r'typedef\s+struct\s*\{[^}]*\}'
-            struct_matches = re.finditer(struct_pattern, code, re.DOTALL)
-            
-            found_declaration = False
-            for struct_match in struct_matches:
-                struct_content = struct_match.group(0)
-                if "jointTable" in struct_content and "morphTable" in struct_content:
-                    found_declaration = True
-                    break
+        if "this->jointTable" in code or "this->morphTable" in code:
+            found_declaration = "typedef" in code and _SKELETON_TABLES_STRUCT_PATTERN.search(code)
             
             if not found_declaration:
                 issues.append("Missing struct members - declare jointTable and morphTable")
         
         # Check for dynamic memory allocation
-        memory_patterns = [
-            r'ZeldaArena_Malloc\s*\(',
-            r'malloc\s*\(',
-            r'dynamic\s+memory\s+allocation',
-            r'memory\s+manager'
-        ]
-        
-        for pattern in memory_patterns:
-            if re.search(pattern, code, re.IGNORECASE):
-                issues.append("Dynamic memory allocation not allowed in actors")
-                break
+        if _MEMORY_ALLOCATION_MATCHER(code, code_lower):
+            issues.append("Dynamic memory allocation not allowed in actors")
         
         # Check for wrong Math_SmoothStepToF usage
-        if re.search(r'[a-zA-Z_][a-zA-Z0-9_]*\s*=\s*Math_SmoothStepToF\s*\(', code):
+        # The leading identifier class retries at every letter, so look for the call first
+        if ("Math_SmoothStepToF" in code and
+            _SMOOTHSTEP_ASSIGNMENT_PATTERN.search(code)):
             issues.append("Wrong Math_SmoothStepToF usage - function returns bool, not float")
         
         return issues
 
     def validate_code(self, code: str, category: str = "general") -> ValidationResult:
         """Validate code authenticity and compile it if possible"""
-        issues = []
-        suggestions = []
-        
+        # Results hold compiler output, so they are only reused with the same compiler
+        cached = self._validation_cache.get((code, category))
+        if cached is None or cached[0] is not self.compiler:
+            result = self._validate_code(code, category)
+            cached = _remember(self._validation_cache, (code, category), (self.compiler, result))
+        result = cached[1]
+        return replace(result, issues=list(result.issues), suggestions=list(result.suggestions))
+
+    def validate_codes(self, codes: List[str], category: str = "general") -> List[ValidationResult]:
+        """Validate many generated outputs, validating and compiling each distinct output once"""
+        results_by_code = {}
+        for code in codes:
+            if code not in results_by_code:
+                results_by_code[code] = self.validate_code(code, category)
+        return [replace(results_by_code[code],
+                        issues=list(results_by_code[code].issues),
+                        suggestions=list(results_by_code[code].suggestions))
+                for code in codes]
+
+    def _validate_code(self, code: str, category: str) -> ValidationResult:
         # Extract C code if present
         extracted_snippets = self.code_extractor.extract_c_code(code)
         
@@ -467,11 +866,13 @@ class StrictAuthenticityValidator:
         compilation_result = None
         if extracted_snippets:
             if self.compiler is None:
-                from src.compilation.c_code_compiler import OoTCompiler
                 self.compiler = OoTCompiler()
             
             # Try to compile the first (largest) code snippet
-            largest_snippet = max(extracted_snippets, key=len) if extracted_snippets else ""
+            if len(extracted_snippets) == 1:
+                largest_snippet = extracted_snippets[0]
+            else:
+                largest_snippet = max(extracted_snippets, key=len)
             
             try:
                 compilation_result = self.compiler.compile_code(largest_snippet)
@@ -489,8 +890,8 @@ class StrictAuthenticityValidator:
         auth_score, auth_issues, auth_suggestions = self._validate_authenticity(code, category)
         
         # Combine issues and suggestions
-        all_issues = auth_issues.copy()
-        all_suggestions = auth_suggestions.copy()
+        all_issues = auth_issues
+        all_suggestions = auth_suggestions
         
         # Add compilation issues if compilation failed
         if compilation_result and not compilation_result.success:
@@ -501,12 +902,9 @@ class StrictAuthenticityValidator:
                     all_issues.append(f"Compilation error: {error}")
             
             # Add compilation-specific suggestions
-            if "unknown type name" in str(compilation_result.error_messages):
-                all_suggestions.append("Include proper OoT header files (z_actor.h, z_play.h, etc.)")
-            if "implicit declaration" in str(compilation_result.error_messages):
-                all_suggestions.append("Add proper function declarations or include required headers")
-            if "undefined reference" in str(compilation_result.error_messages):
-                all_suggestions.append("Ensure all referenced functions are properly declared")
+            errors_text = "\n".join(str(error) for error in compilation_result.error_messages or [])
+            all_suggestions.extend(suggestion for trigger, suggestion in self._COMPILE_HINTS
+                                   if trigger in errors_text)
         
         # Calculate overall score (authenticity + compilation success)
         overall_score = auth_score
@@ -570,120 +968,42 @@ class StrictAuthenticityValidator:
         
         return score, issues, suggestions
 
+    def _run_check(self, code: str, name: str) -> List[str]:
+        """Run one table-driven check"""
+        tripwires, matches, message = _CODE_CHECK_MATCHERS[name]
+        return [message] if _code_check_fails(code, tripwires, matches) else []
+
     def _check_nonexistent_player_health_access(self, code: str) -> List[str]:
         """Check for incorrect player health access patterns."""
-        issues = []
-        
-        # Check for wrong player health access
-        wrong_health_patterns = [
-            r'player->health',
-            r'player->healthCapacity',
-            r'player->maxHealth',
-            r'player->currentHealth'
-        ]
-        
-        for pattern in wrong_health_patterns:
-            if re.search(pattern, code):
-                issues.append("❌ CRITICAL: Wrong player health access - player->health doesn't exist in OoT")
-                break
-        
-        return issues
+        return self._run_check(code, "player_health")
 
     def _check_direct_player_position_manipulation(self, code: str) -> List[str]:
         """Check for direct manipulation of player position from other actors."""
-        issues = []
-        
-        # Check for direct player position manipulation
-        player_pos_patterns = [
-            r'player->actor\.world\.pos\.x\s*[+\-]?=',
-            r'player->actor\.world\.pos\.y\s*[+\-]?=',
-            r'player->actor\.world\.pos\.z\s*[+\-]?=',
-            r'player->actor\.world\.pos\s*[+\-]?=',
-            r'player->actor\.world\.rot\.',
-            r'player->actor\.velocity\.',
-            r'player->actor\.speed'
-        ]
-        
-        for pattern in player_pos_patterns:
-            if re.search(pattern, code):
-                issues.append("❌ CRITICAL: Direct player position/velocity manipulation - OoT never allows other actors to directly manipulate player physics")
-                break
-        
-        return issues
+        return self._run_check(code, "player_position")
 
     def _check_missing_variable_declarations(self, code: str) -> List[str]:
         """Check for missing variable declarations in structs."""
+        # Both checks need a SkelAnime type or a collision call in the code
+        if "SkelAnime" not in code and "Collider_" not in code and "CollisionCheck_" not in code:
+            return []
         issues = []
         
         # Check for SkelAnime usage without declaration
-        if "SkelAnime_" in code or "skelAnime." in code:
+        if "SkelAnime" in code and ("SkelAnime_" in code or "skelAnime." in code):
             # Look for SkelAnime declaration in struct
-            struct_pattern = r'typedef\s+struct\s*\{[^}]*\}'
-            struct_matches = re.finditer(struct_pattern, code, re.DOTALL)
-            
-            for struct_match in struct_matches:
-                struct_content = struct_match.group(0)
-                if "SkelAnime" in code and "SkelAnime skelAnime" not in struct_content:
-                    issues.append("❌ CRITICAL: Missing SkelAnime declaration in struct")
-                    break
+            if any("SkelAnime skelAnime" not in struct_content for struct_content in _typedef_structs(code)):
+                issues.append("❌ CRITICAL: Missing SkelAnime declaration in struct")
         
         # Check for other common missing declarations
-        missing_decl_patterns = [
-            (r'Collider_InitCylinder', r'ColliderCylinder collider'),
-            (r'Collider_UpdateCylinder', r'ColliderCylinder collider'),
-            (r'CollisionCheck_SetOC', r'ColliderCylinder collider'),
-            (r'CollisionCheck_SetAC', r'ColliderCylinder collider')
-        ]
-        
-        for func_pattern, decl_pattern in missing_decl_patterns:
-            if re.search(func_pattern, code) and not re.search(decl_pattern, code):
-                issues.append("❌ CRITICAL: Missing collider declaration in struct")
-                break
+        if _COLLIDER_DECLARATION not in code and any(call in code for call in _COLLIDER_CALLS):
+            issues.append("❌ CRITICAL: Missing collider declaration in struct")
         
         return issues
 
     def _check_wrong_flag_usage(self, code: str) -> List[str]:
         """Check for incorrect flag usage patterns."""
-        issues = []
-        
-        # Check for wrong flag checking patterns
-        wrong_flag_patterns = [
-            r'CHECK_FLAG_ALL\s*\(\s*player->actor\.flags,\s*ACTOR_FLAG_8\s*\)',
-            r'CHECK_FLAG_ALL\s*\(\s*[^,]+,\s*ACTOR_FLAG_[89]\s*\)',
-            r'ACTOR_FLAG_8',
-            r'ACTOR_FLAG_9',
-            r'ACTOR_FLAG_[89]'
-        ]
-        
-        for pattern in wrong_flag_patterns:
-            if re.search(pattern, code):
-                issues.append("❌ CRITICAL: Wrong flag usage - ACTOR_FLAG_8/9 don't exist in OoT")
-                break
-        
-        return issues
+        return self._run_check(code, "flag_usage")
 
     def _check_nonexistent_drawing_functions_enhanced(self, code: str) -> List[str]:
         """Enhanced check for non-existent drawing functions."""
-        issues = []
-        
-        # Check for fabricated drawing functions
-        fabricated_drawing = [
-            r'Gfx_DrawDListOpa\s*\(\s*play,\s*g[A-Z][a-zA-Z0-9_]*DL\s*\)',
-            r'Gfx_DrawDListOpa\s*\(\s*play,\s*[a-z][a-zA-Z0-9_]*DL\s*\)',
-            r'Gfx_DrawDListOpa\s*\(\s*play,\s*[^)]+\s*\)',
-            r'Actor_DrawOpa\s*\(\s*play,\s*[^)]+\s*\)',
-            r'Actor_DrawModel\s*\(\s*play,\s*[^)]+\s*\)',
-            r'Actor_DrawMesh\s*\(\s*play,\s*[^)]+\s*\)',
-            r'Actor_RenderModel\s*\(\s*play,\s*[^)]+\s*\)',
-            r'Actor_DrawScale\s*\(\s*play,\s*[^)]+\s*\)',
-            r'Gfx_DrawDList\s*\(\s*play,\s*[^)]+\s*\)',
-            r'Gfx_DrawModel\s*\(\s*play,\s*[^)]+\s*\)'
-        ]
-        
-        for pattern in fabricated_drawing:
-            if re.search(pattern, code):
-                issues.append("❌ CRITICAL: Non-existent drawing function - Gfx_DrawDListOpa(play, gSomeDL) doesn't exist in OoT")
-                break
-        
-        return issues
-
+        return self._run_check(code, "drawing_functions")
@@ -7,20 +7,144 @@ Parses oot_functions_detailed.txt and validates function calls against authentic
 
 import re
 import os
+import pickle
+import sys
 from typing import Dict, List, Tuple, Optional, Set
 from dataclasses import dataclass
+from functools import lru_cache
 
 from src.core.logger import logger
 
+# Parsed signatures are cached beside the detailed functions file under this
+# suffix; bump the version whenever parsing changes
+_SIGNATURE_CACHE_SUFFIX = ".signatures.pkl"
+_SIGNATURE_CACHE_VERSION = 3
+
+# A signature line, return_type function_name(parameters), on its own and
+# within the whole file; [^\S\n] is whitespace that stays on one line
+_SIGNATURE_PATTERN = re.compile(
+    r'(?P<return_type>[a-zA-Z_][a-zA-Z0-9_]*)\s+(?P<name>[a-zA-Z_][a-zA-Z0-9_]*)\s*\((?P<params>.*)\)'
+)
+_SIGNATURE_LINE_PATTERN = re.compile(
+    r'^[^\S\n]*(?P<return_type>[a-zA-Z_][a-zA-Z0-9_]*)[^\S\n]+(?P<name>[a-zA-Z_][a-zA-Z0-9_]*)'
+    r'[^\S\n]*\((?P<params>.*)\)[^\S\n]*$',
+    re.MULTILINE
+)
+_NAMED_PARAMETER_PATTERN = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)\s+([a-zA-Z_][a-zA-Z0-9_]*)')
+
+# Number of recent code snippets whose call issues are remembered
+_CALL_CACHE_SIZE = 1024
+
+# Argument forms accepted for common OoT parameter types; other types are not checked
+_SIGNED_ARGUMENT_PATTERN = re.compile(r'-?\d+|\w+')  # Integer literals or variable names
+_UNSIGNED_ARGUMENT_PATTERN = re.compile(r'\d+|\w+')  # Unsigned literals or variable names
+_ARGUMENT_TYPE_PATTERNS = {
+    "f32": re.compile(r'-?\d+\.\d+f?|-?\d+\.\d+|\w+'),  # Float literals or variable names
+    "Actor*": re.compile(r'this|actor|\w+\->actor|\w+\.actor|&\w+'),  # Actor pointers
+    "PlayState*": re.compile(r'play'),  # Play state pointer
+    "s32": _SIGNED_ARGUMENT_PATTERN,
+    "s16": _SIGNED_ARGUMENT_PATTERN,
+    "u32": _UNSIGNED_ARGUMENT_PATTERN,
+    "u16": _UNSIGNED_ARGUMENT_PATTERN,
+    "u8": _UNSIGNED_ARGUMENT_PATTERN,
+    "Vec3f*": re.compile(r'&\w+\.pos|\w+\.pos|\w+'),  # Vector pointers
+    "Vec3s*": re.compile(r'&\w+\.rot|\w+\.rot|\w+'),  # Vector pointers
+    "ColliderCylinder*": re.compile(r'&\w+\.collider|\w+\.collider|\w+'),  # Collider pointers
+    "char*": re.compile(r'"[^"]*"'),  # String literals
+    "void*": re.compile(r'NULL|\w+'),  # Void pointers
+}
+
+# Types that accept any plain variable name, so an identifier needs no regex
+_IDENTIFIER_ARGUMENT_TYPES = frozenset(
+    type_name for type_name, pattern in _ARGUMENT_TYPE_PATTERNS.items() if pattern.pattern.endswith(r'|\w+')
+)
+
+
+@lru_cache(maxsize=4096)
+def _argument_has_type(argument: str, expected_type: str) -> bool:
+    """Whether an argument has an accepted form of a checked type, decided once per pair"""
+    if expected_type in _IDENTIFIER_ARGUMENT_TYPES and argument.isascii() and argument.isidentifier():
+        return True
+    # Arguments arrive stripped, so a full match agrees with the old ^...$ anchors
+    return _ARGUMENT_TYPE_PATTERNS[expected_type].fullmatch(argument) is not None
+
+# Start of a call, function_name( , and the C keywords that look like one.
+# A name that fails from its first character fails from any later one, so
+# \b keeps the scan from retrying inside every identifier.
+_CALL_START_PATTERN = re.compile(r'\b(\w+)\s*\(')
+_NON_CALL_KEYWORDS = frozenset({'if', 'for', 'while', 'switch', 'sizeof', 'typedef', 'return'})
+_PAREN_PATTERN = re.compile(r'[()]')
+
+# Assignment of a call's result: variable =, +=, -=, *= or /= ending the text before it
+_ASSIGNMENT_PATTERN = re.compile(r'\b(\w+)\s*[+\-*/]?=\s*$')
+
+# Characters that matter when splitting a list on its top-level commas
+_SPLIT_DELIMITER_PATTERN = re.compile(r'[(),]')
+
+
+def _split_top_level(text: str) -> List[str]:
+    """Split text by commas, respecting parentheses, and strip each piece.
+
+    Empty pieces between commas are kept since they count as arguments;
+    only an empty last piece is dropped.
+    """
+    if '(' in text or ')' in text:
+        pieces = []
+        depth = 0
+        start = 0
+        for match in _SPLIT_DELIMITER_PATTERN.finditer(text):
+            char = match.group()
+            if char == '(':
+                depth += 1
+            elif char == ')':
+                depth -= 1
+            elif depth == 0:
+                pieces.append(text[start:match.start()])
+                start = match.end()
+        pieces.append(text[start:])
+    else:
+        pieces = text.split(',')
+    parts = [piece.strip() for piece in pieces]
+    if not parts[-1]:
+        parts.pop()
+    return parts
+
+
+def _matching_parens(code: str) -> Dict[int, int]:
+    """Map the index of each balanced '(' in code to the index of its ')'"""
+    closing = {}
+    open_at = []
+    for match in _PAREN_PATTERN.finditer(code):
+        if match.group() == '(':
+            open_at.append(match.start())
+        elif open_at:
+            closing[open_at.pop()] = match.start()
+    return closing
+
+
+@lru_cache(maxsize=4096)
+def _unknown_function_issue(function_name: str) -> str:
+    """Issue for a call to a function missing from the database, formatted once per name"""
+    return f"❌ Unknown function: {function_name} - not found in OoT function database"
+
 
 @dataclass
 class FunctionSignature:
     """Represents a function signature with return type and parameters"""
+    # One instance per OoT function, so skip the per-instance __dict__
+    __slots__ = ('name', 'return_type', 'param_types', 'param_names', 'file_location', 'line_number')
+    
     name: str
     return_type: str
-    parameters: List[Tuple[str, str]]  # (type, name) pairs
+    param_types: Tuple[str, ...]
+    param_names: Tuple[str, ...]
     file_location: str
     line_number: int
+    
+    @property
+    def parameters(self) -> List[Tuple[str, str]]:
+        """(type, name) pairs"""
+        return list(zip(self.param_types, self.param_names))
 
 
 class FunctionSignatureValidator:
@@ -29,48 +153,22 @@ class FunctionSignatureValidator:
     def __init__(self, detailed_functions_file: str = "oot_functions_detailed.txt"):
         self.detailed_functions_file = detailed_functions_file
         self.function_signatures: Dict[str, FunctionSignature] = {}
+        self._call_issues_cache: Dict[str, List[str]] = {}
         self.load_function_signatures()
     
     def load_function_signatures(self) -> None:
         """Load and parse function signatures from the detailed functions file"""
+        # Cached call issues were judged against the previous signatures
+        self._call_issues_cache.clear()
         if not os.path.exists(self.detailed_functions_file):
             logger.warning(f"Detailed functions file not found: {self.detailed_functions_file}")
             return
         
         logger.info(f"Loading function signatures from {self.detailed_functions_file}")
         
-        with open(self.detailed_functions_file, 'r') as f:
-            lines = f.readlines()
-        
-        current_function = None
-        
-        for line_num, line in enumerate(lines, 1):
-            line = line.strip()
-            
-            # Skip comments and empty lines
-            if line.startswith('#') or not line:
-                continue
-            
-            # Check if this is a function signature line
-            if '(' in line and ')' in line and not line.startswith('#'):
-                # Parse function signature
-                signature = self._parse_function_signature(line, line_num)
-                if signature:
-                    self.function_signatures[signature.name] = signature
-                    current_function = signature.name
-            
-            # Check if this is a file location line
-            elif line.startswith('#') and ':' in line and current_function:
-                # Extract file location
-                file_info = line[1:].strip()  # Remove #
-                if ':' in file_info:
-                    file_path, line_num_str = file_info.rsplit(':', 1)
-                    if current_function in self.function_signatures:
-                        self.function_signatures[current_function].file_location = file_path
-                        try:
-                            self.function_signatures[current_function].line_number = int(line_num_str)
-                        except ValueError:
-                            pass
+        if not self._load_cached_signatures():
+            self._parse_signatures_file()
+            self._save_cached_signatures()
         
         logger.success(f"Loaded {len(self.function_signatures)} function signatures")
         
@@ -78,102 +176,135 @@ class FunctionSignatureValidator:
         sample_functions = list(self.function_signatures.keys())[:5]
         logger.debug(f"Sample functions: {sample_functions}")
     
+    def _parse_signatures_file(self) -> None:
+        """Parse every signature in the detailed functions file"""
+        with open(self.detailed_functions_file, 'r') as f:
+            text = f.read()
+        
+        # Signature lines are found in one scan; comment and blank lines never match
+        line_num = 1
+        counted_to = 0
+        for match in _SIGNATURE_LINE_PATTERN.finditer(text):
+            line_num += text.count('\n', counted_to, match.start())
+            counted_to = match.start()
+            signature = self._build_signature(match, line_num)
+            if signature:
+                self.function_signatures[signature.name] = signature
+    
+    def _signature_cache_key(self) -> Tuple[int, int, int]:
+        """Identify the detailed functions file contents a cache was built from"""
+        stat = os.stat(self.detailed_functions_file)
+        return _SIGNATURE_CACHE_VERSION, stat.st_mtime_ns, stat.st_size
+    
+    def _load_cached_signatures(self) -> bool:
+        """Load signatures parsed on an earlier run, if the file is unchanged since"""
+        cache_file = self.detailed_functions_file + _SIGNATURE_CACHE_SUFFIX
+        try:
+            with open(cache_file, 'rb') as f:
+                key, signatures = pickle.load(f)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable signature cache {cache_file}: {e}")
+            return False
+        if key != self._signature_cache_key():
+            return False
+        self.function_signatures.update(signatures)
+        return True
+    
+    def _save_cached_signatures(self) -> None:
+        """Store the parsed signatures for the next run; failing to is not an error"""
+        cache_file = self.detailed_functions_file + _SIGNATURE_CACHE_SUFFIX
+        temp_file = f"{cache_file}.{os.getpid()}.tmp"
+        try:
+            with open(temp_file, 'wb') as f:
+                pickle.dump((self._signature_cache_key(), self.function_signatures), f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, cache_file)
+        except OSError as e:
+            logger.debug(f"Could not write signature cache {cache_file}: {e}")
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+    
     def _parse_function_signature(self, signature_line: str, line_num: int) -> Optional[FunctionSignature]:
         """Parse a function signature line into a FunctionSignature object"""
+        # Match pattern: return_type function_name(param1_type param1_name, param2_type param2_name, ...)
+        # or: return_type function_name(param1_type, param2_type, ...)
+        match = _SIGNATURE_PATTERN.fullmatch(signature_line)
+        if not match:
+            return None
+        return self._build_signature(match, line_num)
+    
+    def _build_signature(self, match: "re.Match", line_num: int) -> Optional[FunctionSignature]:
+        """Build a FunctionSignature from a matched return type, name and parameter list"""
         try:
-            # Match pattern: return_type function_name(param1_type param1_name, param2_type param2_name, ...)
-            # or: return_type function_name(param1_type, param2_type, ...)
-            
-            # First, extract the return type and function name
-            match = re.match(r'^([a-zA-Z_][a-zA-Z0-9_]*)\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\((.*)\)$', signature_line)
-            if not match:
-                return None
-            
-            return_type = match.group(1)
-            function_name = match.group(2)
-            params_str = match.group(3)
+            # Only a few dozen distinct types occur, so share one string per type
+            return_type = sys.intern(match.group('return_type'))
+            function_name = match.group('name')
+            params_str = match.group('params')
             
             # Parse parameters
-            parameters = []
+            param_types = []
+            param_names = []
             if params_str.strip():
                 # Split by comma, but be careful about nested parentheses
-                param_parts = self._split_parameters(params_str)
+                param_parts = _split_top_level(params_str)
                 
                 for param in param_parts:
-                    param = param.strip()
                     if param:
                         # Handle both "type name" and "type" formats
-                        param_match = re.match(r'^([a-zA-Z_][a-zA-Z0-9_]*)\s+([a-zA-Z_][a-zA-Z0-9_]*)$', param)
+                        param_match = _NAMED_PARAMETER_PATTERN.fullmatch(param)
                         if param_match:
                             # "type name" format
-                            param_type = param_match.group(1)
+                            param_type = sys.intern(param_match.group(1))
                             param_name = param_match.group(2)
                         else:
                             # "type" format (no parameter name)
-                            param_type = param
-                            param_name = f"arg{len(parameters)}"
+                            param_type = sys.intern(param)
+                            param_name = f"arg{len(param_types)}"
                         
-                        parameters.append((param_type, param_name))
+                        param_types.append(param_type)
+                        param_names.append(param_name)
             
             return FunctionSignature(
                 name=function_name,
                 return_type=return_type,
-                parameters=parameters,
+                param_types=tuple(param_types),
+                param_names=tuple(param_names),
                 file_location="",
                 line_number=line_num
             )
             
         except Exception as e:
-            logger.debug(f"Failed to parse function signature at line {line_num}: {signature_line} - {e}")
+            logger.debug(f"Failed to parse function signature at line {line_num}: {match.group().strip()} - {e}")
             return None
     
-    def _split_parameters(self, params_str: str) -> List[str]:
-        """Split parameter string by commas, respecting parentheses"""
-        params = []
-        current_param = ""
-        paren_count = 0
-        
-        for char in params_str:
-            if char == '(':
-                paren_count += 1
-            elif char == ')':
-                paren_count -= 1
-            elif char == ',' and paren_count == 0:
-                params.append(current_param.strip())
-                current_param = ""
-                continue
-            
-            current_param += char
-        
-        if current_param.strip():
-            params.append(current_param.strip())
-        
-        return params
-    
-    def validate_function_call(self, function_name: str, arguments: List[str], 
+    def validate_function_call(self, function_name: str, arguments: Optional[List[str]], 
                              return_usage: Optional[str] = None) -> List[str]:
-        """Validate a function call against the authentic signature"""
+        """Validate a function call against the authentic signature
+
+        arguments is None for a call whose argument list never closes (e.g.
+        truncated code); the name and return usage are still checked.
+        """
         issues = []
         
-        if function_name not in self.function_signatures:
-            issues.append(f"❌ Unknown function: {function_name} - not found in OoT function database")
-            return issues
-        
-        signature = self.function_signatures[function_name]
-        
-        # Validate argument count
-        expected_count = len(signature.parameters)
-        actual_count = len(arguments)
-        
-        if actual_count != expected_count:
-            issues.append(f"❌ Function {function_name}: expected {expected_count} arguments, got {actual_count}")
+        signature = self.function_signatures.get(function_name)
+        if signature is None:
+            issues.append(_unknown_function_issue(function_name))
             return issues
         
-        # Validate argument types (basic validation)
-        for i, (expected_type, expected_name) in enumerate(signature.parameters):
-            if i < len(arguments):
-                arg = arguments[i].strip()
-                type_issue = self._validate_argument_type(arg, expected_type, function_name, i)
+        if arguments is not None:
+            # Validate argument count
+            expected_count = len(signature.param_types)
+            actual_count = len(arguments)
+            
+            if actual_count != expected_count:
+                issues.append(f"❌ Function {function_name}: expected {expected_count} arguments, got {actual_count}")
+                return issues
+            
+            # Validate argument types (basic validation)
+            for i, (expected_type, argument) in enumerate(zip(signature.param_types, arguments)):
+                type_issue = self._validate_argument_type(argument.strip(), expected_type, function_name, i)
                 if type_issue:
                     issues.append(type_issue)
         
@@ -189,131 +320,50 @@ class FunctionSignatureValidator:
                                function_name: str, arg_index: int) -> Optional[str]:
         """Validate that an argument matches the expected type"""
         # Basic type checking - this could be enhanced with more sophisticated parsing
-        
-        # Common OoT types and their patterns
-        type_patterns = {
-            "Actor*": r"this|actor|\w+\->actor|\w+\.actor|&\w+",
-            "PlayState*": r"play",
-            "f32": r"-?\d+\.\d+f?|-?\d+\.\d+|\w+",  # Allow variable names for f32
-            "s32": r"-?\d+|\w+",  # Allow variable names for s32
-            "s16": r"-?\d+|\w+",  # Allow variable names for s16
-            "u32": r"\d+|\w+",  # Allow variable names for u32
-            "u16": r"\d+|\w+",  # Allow variable names for u16
-            "u8": r"\d+|\w+",  # Allow variable names for u8
-            "Vec3f*": r"&\w+\.pos|\w+\.pos|\w+",
-            "Vec3s*": r"&\w+\.rot|\w+\.rot|\w+",
-            "ColliderCylinder*": r"&\w+\.collider|\w+\.collider|\w+",
-            "char*": r'"[^"]*"',
-            "void*": r"NULL|\w+",
-        }
-        
-        # For strict type checking, we need to be more specific
-        if expected_type == "f32":
-            # Check for float literals or variable names
-            if not re.match(r'^-?\d+\.\d+f?$|^-?\d+\.\d+$|^\w+$', argument):
-                return f"❌ Function {function_name} arg {arg_index + 1}: expected {expected_type}, got '{argument}'"
-        elif expected_type == "Actor*":
-            # Check for actor pointers
-            if not re.match(r'^this$|^actor$|^\w+\->actor$|^\w+\.actor$|^&\w+$', argument):
-                return f"❌ Function {function_name} arg {arg_index + 1}: expected {expected_type}, got '{argument}'"
-        elif expected_type == "PlayState*":
-            # Check for play state pointer
-            if not re.match(r'^play$', argument):
-                return f"❌ Function {function_name} arg {arg_index + 1}: expected {expected_type}, got '{argument}'"
-        elif expected_type == "s32":
-            # Check for integer literals or variable names
-            if not re.match(r'^-?\d+$|^\w+$', argument):
-                return f"❌ Function {function_name} arg {arg_index + 1}: expected {expected_type}, got '{argument}'"
-        elif expected_type == "s16":
-            # Check for integer literals or variable names
-            if not re.match(r'^-?\d+$|^\w+$', argument):
-                return f"❌ Function {function_name} arg {arg_index + 1}: expected {expected_type}, got '{argument}'"
-        elif expected_type == "u32":
-            # Check for unsigned integer literals or variable names
-            if not re.match(r'^\d+$|^\w+$', argument):
-                return f"❌ Function {function_name} arg {arg_index + 1}: expected {expected_type}, got '{argument}'"
-        elif expected_type == "u16":
-            # Check for unsigned integer literals or variable names
-            if not re.match(r'^\d+$|^\w+$', argument):
-                return f"❌ Function {function_name} arg {arg_index + 1}: expected {expected_type}, got '{argument}'"
-        elif expected_type == "u8":
-            # Check for unsigned integer literals or variable names
-            if not re.match(r'^\d+$|^\w+$', argument):
-                return f"❌ Function {function_name} arg {arg_index + 1}: expected {expected_type}, got '{argument}'"
-        elif expected_type == "Vec3f*":
-            # Check for vector pointers
-            if not re.match(r'^&\w+\.pos$|^\w+\.pos$|^\w+$', argument):
-                return f"❌ Function {function_name} arg {arg_index + 1}: expected {expected_type}, got '{argument}'"
-        elif expected_type == "Vec3s*":
-            # Check for vector pointers
-            if not re.match(r'^&\w+\.rot$|^\w+\.rot$|^\w+$', argument):
-                return f"❌ Function {function_name} arg {arg_index + 1}: expected {expected_type}, got '{argument}'"
-        elif expected_type == "ColliderCylinder*":
-            # Check for collider pointers
-            if not re.match(r'^&\w+\.collider$|^\w+\.collider$|^\w+$', argument):
-                return f"❌ Function {function_name} arg {arg_index + 1}: expected {expected_type}, got '{argument}'"
-        elif expected_type == "char*":
-            # Check for string literals
-            if not re.match(r'^"[^"]*"$', argument):
-                return f"❌ Function {function_name} arg {arg_index + 1}: expected {expected_type}, got '{argument}'"
-        elif expected_type == "void*":
-            # Check for void pointers
-            if not re.match(r'^NULL$|^\w+$', argument):
-                return f"❌ Function {function_name} arg {arg_index + 1}: expected {expected_type}, got '{argument}'"
+        # Most parameter types have no pattern; generated code repeats the same
+        # literals and names, so each (argument, type) pair is matched once
+        if expected_type in _ARGUMENT_TYPE_PATTERNS and not _argument_has_type(argument, expected_type):
+            return f"❌ Function {function_name} arg {arg_index + 1}: expected {expected_type}, got '{argument}'"
         
         return None
     
     def _check_return_usage(self, code: str, call_start: int, function_name: str) -> Optional[str]:
         """Check if the function call's return value is used"""
-        # Look for assignment patterns before the function call
-        lines = code[:call_start].split('\n')
-        if lines:
-            last_line = lines[-1].strip()
-            
-            # Check for assignment patterns
-            assignment_patterns = [
-                r'(\w+)\s*=\s*$',  # variable = 
-                r'(\w+)\s*\+=\s*$',  # variable +=
-                r'(\w+)\s*-=\s*$',   # variable -=
-                r'(\w+)\s*\*=\s*$',  # variable *=
-                r'(\w+)\s*/=\s*$',   # variable /=
-            ]
-            
-            for pattern in assignment_patterns:
-                match = re.search(pattern, last_line)
-                if match:
-                    return match.group(1)
+        # Look for assignment patterns before the function call, on its own line
+        line_start = code.rfind('\n', 0, call_start) + 1
+        match = _ASSIGNMENT_PATTERN.search(code, line_start, call_start)
+        if match:
+            return match.group(1)
         
         # Also check for direct usage in expressions
         # Look ahead in the code to see if the function call is part of an expression
-        code_after = code[call_start:]
-        if code_after:
+        next_char = code[call_start:call_start + 1]
+        if next_char:
             # Check if the function call is followed by operators or used in expressions
-            next_char = code_after[0] if code_after else ''
-            if next_char in ['+', '-', '*', '/', ';', ',', ')']:
+            if next_char in '+-*/;,)':
                 # Function call is used in an expression
                 return "expression"
         
         return None
     
-    def extract_function_calls(self, code: str) -> List[Tuple[str, List[str], Optional[str]]]:
+    def extract_function_calls(self, code: str) -> List[Tuple[str, Optional[List[str]], Optional[str]]]:
         """Extract function calls from C code with their arguments and return usage"""
         function_calls = []
         
-        # Pattern to match function calls: function_name(arg1, arg2, ...)
-        # Also capture if the result is assigned to something
-        call_pattern = r'(\w+)\s*\(([^)]*)\)'
+        # Every function_name( opening, nested calls included, runs to its balancing ')'
+        closing_parens = _matching_parens(code)
         
-        for match in re.finditer(call_pattern, code):
+        for match in _CALL_START_PATTERN.finditer(code):
             function_name = match.group(1)
-            args_str = match.group(2)
             
             # Skip common C keywords and builtins
-            if function_name in ['if', 'for', 'while', 'switch', 'sizeof', 'typedef', 'return']:
+            if function_name in _NON_CALL_KEYWORDS:
                 continue
             
-            # Parse arguments
-            arguments = self._parse_function_arguments(args_str)
+            # Calls left open (e.g. truncated code) have no argument list to check,
+            # but their names still are
+            args_end = closing_parens.get(match.end() - 1)
+            arguments = None if args_end is None else _split_top_level(code[match.end():args_end])
             
             # Check if return value is used
             return_usage = self._check_return_usage(code, match.start(), function_name)
@@ -322,34 +372,25 @@ class FunctionSignatureValidator:
         
         return function_calls
     
-    def _parse_function_arguments(self, args_str: str) -> List[str]:
-        """Parse function arguments from a string"""
-        if not args_str.strip():
-            return []
-        
-        args = []
-        current_arg = ""
-        paren_count = 0
-        
-        for char in args_str:
-            if char == '(':
-                paren_count += 1
-            elif char == ')':
-                paren_count -= 1
-            elif char == ',' and paren_count == 0:
-                args.append(current_arg.strip())
-                current_arg = ""
-                continue
-            
-            current_arg += char
-        
-        if current_arg.strip():
-            args.append(current_arg.strip())
-        
-        return args
-    
     def validate_code_function_calls(self, code: str) -> List[str]:
         """Validate all function calls in a piece of code"""
+        issues = self._call_issues_cache.get(code)
+        if issues is None:
+            issues = self._validate_code_function_calls(code)
+            if len(self._call_issues_cache) >= _CALL_CACHE_SIZE:
+                del self._call_issues_cache[next(iter(self._call_issues_cache))]
+            self._call_issues_cache[code] = issues
+        return list(issues)
+    
+    def validate_batch(self, codes: List[str]) -> List[List[str]]:
+        """Validate the function calls of many snippets, each distinct snippet once"""
+        issues_by_code = {}
+        for code in codes:
+            if code not in issues_by_code:
+                issues_by_code[code] = self.validate_code_function_calls(code)
+        return [list(issues_by_code[code]) for code in codes]
+    
+    def _validate_code_function_calls(self, code: str) -> List[str]:
         issues = []
         
         function_calls = self.extract_function_calls(code)